@@ -4,4 +4,4 @@ from .utils import *
 from .gltf import GLTF
 from .gltf_resource import (
     GLTFResource, FileResource, ExternalResource, GLBResource, Base64Resource, GLB_BINARY_CHUNK_TYPE,
-    GLB_JSON_CHUNK_TYPE)
+    GLB_JSON_CHUNK_TYPE, GLB_BINARY_CHUNK_TYPE_BYTES, GLB_JSON_CHUNK_TYPE_BYTES)
@@ -2,22 +2,46 @@ import struct
 import copy
 import warnings
 import codecs
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from os import path
 from urllib.parse import urlparse, unquote
-from typing import Tuple, List, Iterator, Iterable, Optional, Set, BinaryIO
+from typing import Tuple, List, Dict, Iterator, Iterable, Optional, Set, BinaryIO
 from .gltf_resource import (
     GLTFResource, FileResource, ExternalResource, GLBResource, Base64Resource, GLB_JSON_CHUNK_TYPE,
-    GLB_BINARY_CHUNK_TYPE)
+    GLB_BINARY_CHUNK_TYPE, GLB_JSON_CHUNK_TYPE_BYTES, GLB_BINARY_CHUNK_TYPE_BYTES)
 from .models import GLTFModel, Buffer, BufferView, Image
-from .utils import padbytes, create_parent_dirs
+from .utils import padbytes, create_parent_dirs, write_buffers, json_loads, COMPACT_SEPARATORS
+
+# Pre-compiled structs for the GLB file header (magic, version, length) and chunk headers (length, type). The chunk
+# header is read with an integer chunk type, and written with the chunk type already packed as bytes.
+_GLB_HEADER = struct.Struct('<4sII')
+_GLB_CHUNK_HEADER = struct.Struct('<II')
+_GLB_PACKED_CHUNK_HEADER = struct.Struct('<I4s')
+_UINT32 = struct.Struct('<I')
+
+# Zero padding written after binary chunk data, indexed by the number of padding bytes (chunks are 4-byte aligned)
+_ZERO_PADDING = (b'', b'\x00', b'\x00\x00', b'\x00\x00\x00')
+
+# Maximum number of threads used to load or save file resources concurrently
+_MAX_RESOURCE_IO_THREADS = 16
+
+# Byte order marks that require the JSON data to be decoded to a string before parsing (see GLTF._decode_bytes)
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)
 
 
 class GLTF:
     GLB_HEADER_BYTELENGTH = 12
+    # GLBs up to this size are assembled in memory and written with a single call. Larger GLBs are written chunk by
+    # chunk to avoid holding a second copy of all the embedded data in memory.
+    GLB_BUFFERED_WRITE_MAX_BYTELENGTH = 16 * 1024 * 1024
 
     def __init__(self, model: GLTFModel = None, resources: List[GLTFResource] = None):
         self.model = model
         self.resources = resources
+        # Data embedded in the GLB resource that has not been copied into it yet, as (offset, data) tuples (see
+        # _defer_glb_data_merge). None when data is merged into the GLB resource immediately.
+        self._pending_glb_data: Optional[List[Tuple[int, bytes]]] = None
 
     @classmethod
     def load(cls: 'GLTF', filename: str, load_file_resources=False, resources: List[GLTFResource] = None,
@@ -114,8 +138,7 @@ class GLTF:
         """
         gltf = GLTF(model=None, resources=resources)
         data = stream.read()
-        json = GLTF._decode_bytes(data, encoding)
-        gltf.model = GLTFModel.from_json(json)
+        gltf.model = GLTF._decode_model(data, encoding)
         gltf._load_resources(basepath, load_file_resources)
         return gltf
 
@@ -145,7 +168,11 @@ class GLTF:
 
     @property
     def glb_resources(self):
-        return [resource for resource in self.resources if isinstance(resource, GLBResource)]
+        return list(self._iter_glb_resources())
+
+    def _iter_glb_resources(self) -> Iterator[GLBResource]:
+        """Iterates over the GLB resources without building an intermediate list (used internally by lookups)."""
+        return (resource for resource in self.resources if isinstance(resource, GLBResource))
 
     def export(self, filename: str, save_file_resources=True) -> 'GLTF':
         """
@@ -247,18 +274,18 @@ class GLTF:
                             "provided helper methods in this class (GLTF.convert_to_file_resource,"
                             "GLTF.convert_to_base64_resource, or GLTF.convert_to_external_resource) prior to "
                             "exporting to GLTF, or export to GLB instead.")
-        data = self.model.to_json()
-        stream.write(data.encode("UTF-8"))
+        stream.write(self.model.to_json_bytes())
         if save_file_resources:
             self._validate_resources()
             self._export_file_resources(basepath)
 
     def _write_glb(self, stream: BinaryIO, embed_buffer_resources=True, embed_image_resources=True,
                 save_file_resources=True, basepath: str=None) -> None:
-        if embed_buffer_resources:
-            self._embed_buffer_resources()
-        if embed_image_resources:
-            self._embed_image_resources()
+        with self._defer_glb_data_merge():
+            if embed_buffer_resources:
+                self._embed_buffer_resources()
+            if embed_image_resources:
+                self._embed_image_resources()
         self._write_glb_proper(stream)
         if save_file_resources:
             self._validate_resources()
@@ -274,23 +301,31 @@ class GLTF:
         return GLTF(model, resources)
 
     def get_resource(self, uri: str, strict: bool = False) -> GLTFResource:
-        return next((
-            resource
-            for resource in (self.resources or [])
-            if uri in
-               (
-                   {resource.uri} if not isinstance(resource, FileResource) or strict
-                   else {resource.uri, resource.filename}
-               )
-        ), None)
+        for resource in (self.resources or []):
+            if resource.uri == uri or (not strict and isinstance(resource, FileResource) and resource.filename == uri):
+                return resource
+        return None
+
+    def _get_resources_by_uri(self) -> Dict[str, GLTFResource]:
+        """
+        Returns a dictionary mapping URIs to resources, allowing multiple resources to be looked up without scanning the
+        resources list each time. FileResources are additionally keyed by their filename. This is consistent with
+        get_resource (non-strict): if more than one resource matches a given URI, the first one in the list is used.
+        """
+        resources_by_uri = {}
+        for resource in (self.resources or []):
+            resources_by_uri.setdefault(resource.uri, resource)
+            if isinstance(resource, FileResource):
+                resources_by_uri.setdefault(resource.filename, resource)
+        return resources_by_uri
 
     def get_glb_resource(self, resource_type: int = GLB_BINARY_CHUNK_TYPE) -> GLBResource:
-        for resource in self.glb_resources:
+        for resource in self._iter_glb_resources():
             if resource.resource_type == resource_type:
                 return resource
 
     def get_glb_resources_of_type(self, resource_type: int) -> List[GLBResource]:
-        return [resource for resource in self.glb_resources if resource.resource_type == resource_type]
+        return [resource for resource in self._iter_glb_resources() if resource.resource_type == resource_type]
 
     def remove_resource_by_uri(self, uri: str) -> None:
         resource = self.get_resource(uri)
@@ -317,8 +352,7 @@ class GLTF:
         if isinstance(resource, FileResource) and not resource.loaded:
             resource.load()
         if isinstance(resource, FileResource) or isinstance(resource, Base64Resource):
-            data = bytearray(resource.data)
-            glb_resource, offset, bytelen = self._create_or_extend_glb_resource(data)
+            glb_resource, offset, bytelen = self._create_or_extend_glb_resource(resource.data)
             self.resources.remove(resource)
             self._update_model_after_embedding_resource(resource, offset, bytelen)
         return glb_resource
@@ -471,6 +505,22 @@ class GLTF:
             resource.uri = uri
             return resource
 
+    @classmethod
+    def _decode_model(cls: 'GLTF', data: bytes, encoding: str = None) -> GLTFModel:
+        """
+        Decodes the model from JSON data. In the common case (UTF-8 without BOM, as required by the spec), the JSON is
+        parsed directly from bytes without first decoding it to a string. Otherwise, or if the data turns out not to be
+        valid UTF-8, the data is decoded to a string first using _decode_bytes.
+        """
+        if encoding is None and not data.startswith(_BOMS):
+            try:
+                kvs = json_loads(data)
+            except ValueError:
+                pass
+            else:
+                return GLTFModel.from_dict(kvs)
+        return GLTFModel.from_json(cls._decode_bytes(data, encoding))
+
     @classmethod
     def _decode_bytes(cls: 'GLTF', data: bytes, encoding: str = None) -> str:
         if encoding is not None:
@@ -492,94 +542,100 @@ class GLTF:
                 self.resources.append(resource)
 
     def _validate_resources(self) -> None:
+        resources_by_uri = self._get_resources_by_uri()
         for uri in self._get_resource_uris_from_model():
-            resource = self.get_resource(uri)
+            resource = resources_by_uri.get(uri)
             if resource is None:
                 raise RuntimeError(f'Missing resource with uri: "{uri}".')
 
     def _export_file_resources(self, basepath: str) -> None:
         if self.resources is None or len(self.resources) == 0:
             return
-        for resource in self.resources:
-            if isinstance(resource, FileResource):
+        file_resources = [resource for resource in self.resources if isinstance(resource, FileResource)]
+        filenames = {resource.filename for resource in file_resources}
+        if len(file_resources) < 2 or len(filenames) < len(file_resources):
+            # Resources that share a filename are saved one after another, so that the last one wins (as it would if
+            # the files were written in order) rather than having concurrent writes to the same file interleave
+            for resource in file_resources:
                 resource.export(basepath)
+            return
+        # Saving resources is I/O bound, so multiple resources are saved concurrently
+        with ThreadPoolExecutor(max_workers=min(_MAX_RESOURCE_IO_THREADS, len(file_resources))) as executor:
+            for _ in executor.map(lambda resource: resource.export(basepath), file_resources):
+                pass
 
     def _load_glb(self, f: BinaryIO, json_encoding: str = None) -> None:
         self.resources = []
         bytelen = self._load_glb_header(f)
-        self._load_glb_chunks(f, json_encoding)
-        pos = f.tell()
+        pos = self.GLB_HEADER_BYTELENGTH + self._load_glb_chunks(f, json_encoding)
         if pos != bytelen:
             warnings.warn(f'GLB file length specified in file header ({bytelen}) does not match number of bytes '
                           f'read ({pos}). The GLB file may be corrupt.', RuntimeWarning)
 
     def _load_glb_header(self, f: BinaryIO) -> int:
         b = f.read(self.GLB_HEADER_BYTELENGTH)
-        magic = b[0:4]
+        if len(b) != self.GLB_HEADER_BYTELENGTH:
+            raise RuntimeError('File is not a valid GLB file')
+        magic, version, bytelen = _GLB_HEADER.unpack(b)
         if magic != b'glTF':
             raise RuntimeError('File is not a valid GLB file')
-        version, = struct.unpack_from('<I', b, 4)
         if version != 2:
             raise RuntimeError(f'Unsupported GLB file version: "{version}". Only version 2 is currently supported')
-        bytelen, = struct.unpack_from('<I', b, 8)
         return bytelen
 
-    def _load_glb_chunks(self, f: BinaryIO, json_encoding: str = None) -> None:
-        while self._load_glb_chunk(f, json_encoding):
-            pass
-
-    def _load_glb_chunk(self, f: BinaryIO, json_encoding: str = None) -> bool:
+    def _load_glb_chunks(self, f: BinaryIO, json_encoding: str = None) -> int:
+        """Loads all remaining chunks from the stream, and returns the total number of bytes read."""
+        total = 0
+        while True:
+            bytes_read = self._load_glb_chunk(f, json_encoding)
+            if bytes_read == 0:
+                return total
+            total += bytes_read
+
+    def _load_glb_chunk(self, f: BinaryIO, json_encoding: str = None) -> int:
+        """Loads the next chunk from the stream, and returns the number of bytes read (0 at the end of the stream)."""
         b = f.read(8)
         if b == b'':
-            return False
+            return 0
         if len(b) != 8:
             raise RuntimeError(f'Unexpected EOF when processing GLB chunk header. Chunk header must be 8 bytes, '
                                f'got {len(b)} bytes.')
-        chunk_length, = struct.unpack_from('<I', b, 0)
-        chunk_type, = struct.unpack_from('<I', b, 4)
+        chunk_length, chunk_type = _GLB_CHUNK_HEADER.unpack(b)
         if chunk_type == GLB_JSON_CHUNK_TYPE:
-            self._load_glb_json_chunk_body(f, chunk_length, json_encoding)
-        else:
-            self._load_glb_binary_chunk_body(f, chunk_type, chunk_length)
-        return True
+            return 8 + self._load_glb_json_chunk_body(f, chunk_length, json_encoding)
+        return 8 + self._load_glb_binary_chunk_body(f, chunk_type, chunk_length)
 
-    def _load_glb_json_chunk_body(self, f: BinaryIO, bytelen: int, json_encoding: str = None) -> None:
+    def _load_glb_json_chunk_body(self, f: BinaryIO, bytelen: int, json_encoding: str = None) -> int:
         if bytelen == 0:
             raise RuntimeError('JSON chunk may not be empty')
         b = f.read(bytelen)
         if len(b) != bytelen:
             warnings.warn(f'Unexpected EOF when parsing JSON chunk body. The GLB file may be corrupt.', RuntimeWarning)
-        model_json = GLTF._decode_bytes(b, json_encoding)
-        self.model = GLTFModel.from_json(model_json)
+        self.model = GLTF._decode_model(b, json_encoding)
+        return len(b)
 
-    def _load_glb_binary_chunk_body(self, f: BinaryIO, chunk_type: int, bytelen: int) -> None:
+    def _load_glb_binary_chunk_body(self, f: BinaryIO, chunk_type: int, bytelen: int) -> int:
         b = f.read(bytelen)
         if len(b) != bytelen:
             warnings.warn(f'Unexpected EOF when parsing binary chunk body. The GLB file may be corrupt.',
                           RuntimeWarning)
         resource = GLBResource(b, chunk_type)
         self.resources.append(resource)
+        return len(b)
 
     def _get_resource_uris_from_model(self) -> Set:
-        uris = set()
-        if self.model.buffers is not None:
-            uris.update([buffer.uri for buffer in self.model.buffers if buffer.uri is not None])
-        if self.model.images is not None:
-            uris.update([image.uri for image in self.model.images
-                         if image.uri is not None and image.bufferView is None])
+        uris = {buffer.uri for buffer in (self.model.buffers or ()) if buffer.uri is not None}
+        uris.update(image.uri for image in (self.model.images or ())
+                    if image.uri is not None and image.bufferView is None)
         return uris
 
     def _get_buffers_by_uri(self, uri) -> Iterator[Tuple[int, Buffer]]:
-        if self.model.buffers is None:
-            return
-        for i, buffer in enumerate(self.model.buffers):
+        for i, buffer in enumerate(self.model.buffers or ()):
             if buffer.uri == uri:
                 yield i, buffer
 
     def _get_images_by_uri(self, uri) -> Iterator[Tuple[int, Image]]:
-        if self.model.images is None:
-            return
-        for i, image in enumerate(self.model.images):
+        for i, image in enumerate(self.model.images or ()):
             if image.uri == uri:
                 yield i, image
 
@@ -590,44 +646,77 @@ class GLTF:
             image.uri = new_uri
 
     def _write_glb_proper(self, f: BinaryIO):
-        self._prepare_glb()
-        self._write_glb_header(f)
-        self._write_glb_body(f)
+        bytelen = self._prepare_glb()
+        if bytelen <= self.GLB_BUFFERED_WRITE_MAX_BYTELENGTH:
+            f.write(self._build_glb(bytelen))
+        else:
+            self._write_glb_chunks(f, bytelen)
 
-    def _prepare_glb(self):
-        json_bytes = bytearray(self.model.to_json(separators=(',', ':')).encode('utf-8'))
+    def _prepare_glb(self) -> int:
+        """
+        Prepares the list of chunks to write to the GLB, and returns the total byte length of the GLB. Each chunk is a
+        tuple of (padded byte length, packed chunk type, data). Note the data for binary chunks is not padded (to avoid
+        copying it), so it may be up to 3 bytes shorter than the padded byte length.
+        """
+        json_bytes = bytearray(self.model.to_json_bytes(separators=COMPACT_SEPARATORS))
         json_len = padbytes(json_bytes, 4, b'\x20')
-        json_chunk = (json_len, GLB_JSON_CHUNK_TYPE, json_bytes)
+        json_chunk = (json_len, GLB_JSON_CHUNK_TYPE_BYTES, json_bytes)
         self._chunks = [json_chunk]
-        for resource in self.glb_resources:
+        for resource in self._iter_glb_resources():
             data = resource.data
-            bytelen = len(data)
-            if bytelen % 4 != 0:
-                data = bytearray(data)
-                bytelen = padbytes(data, 4)
-            chunk = (bytelen, resource.resource_type, data)
+            chunk = ((len(data) + 3) & ~3, self._pack_chunk_type(resource.resource_type), data)
             self._chunks.append(chunk)
+        chunk_header_len = _GLB_PACKED_CHUNK_HEADER.size
+        return self.GLB_HEADER_BYTELENGTH + sum(chunk[0] + chunk_header_len for chunk in self._chunks)
 
-    def _write_glb_header(self, f: BinaryIO):
-        chunk_header_len = 8
-        bytelen = self.GLB_HEADER_BYTELENGTH + sum(chunk[0] + chunk_header_len for chunk in self._chunks)
-        output = bytearray()
-        output.extend(b'glTF')
-        output.extend(struct.pack('<I', 2))
-        output.extend(struct.pack('<I', bytelen))
-        f.write(output)
-
-    def _write_glb_body(self, f: BinaryIO):
-        for chunk in self._chunks:
-            bytelen, chunk_type, data = chunk
-            f.write(struct.pack('<I', bytelen))
-            f.write(struct.pack('<I', chunk_type))
-            f.write(data)
+    @staticmethod
+    def _pack_chunk_type(chunk_type: int) -> bytes:
+        if chunk_type == GLB_BINARY_CHUNK_TYPE:
+            return GLB_BINARY_CHUNK_TYPE_BYTES
+        if chunk_type == GLB_JSON_CHUNK_TYPE:
+            return GLB_JSON_CHUNK_TYPE_BYTES
+        return _UINT32.pack(chunk_type)
+
+    def _build_glb(self, bytelen: int) -> bytearray:
+        """
+        Assembles the GLB header and all chunks prepared by _prepare_glb into a single pre-allocated buffer, so that
+        the GLB can be written out with a single call.
+        """
+        chunk_header_len = _GLB_PACKED_CHUNK_HEADER.size
+        output = bytearray(bytelen)
+        _GLB_HEADER.pack_into(output, 0, b'glTF', 2, bytelen)
+        offset = self.GLB_HEADER_BYTELENGTH
+        for chunk_bytelen, chunk_type, data in self._chunks:
+            _GLB_PACKED_CHUNK_HEADER.pack_into(output, offset, chunk_bytelen, chunk_type)
+            offset += chunk_header_len
+            # Any padding after the data is already zero-filled
+            output[offset:offset + len(data)] = data
+            offset += chunk_bytelen
+        return output
+
+    def _write_glb_chunks(self, f: BinaryIO, bytelen: int) -> None:
+        """
+        Writes the GLB header and all chunks prepared by _prepare_glb to the stream without assembling them into a
+        single buffer first. This is used for large GLBs, where assembling the whole GLB in memory first would double
+        the peak memory usage. The chunk data is passed to the stream by reference, in a single gather write where
+        supported.
+        """
+        buffers = [_GLB_HEADER.pack(b'glTF', 2, bytelen)]
+        for chunk_bytelen, chunk_type, data in self._chunks:
+            buffers.append(_GLB_PACKED_CHUNK_HEADER.pack(chunk_bytelen, chunk_type))
+            buffers.append(data)
+            padlen = chunk_bytelen - len(data)
+            if padlen > 0:
+                buffers.append(_ZERO_PADDING[padlen])
+        write_buffers(f, buffers)
 
     def _embed_buffer_resources(self):
         if self.model.buffers is None:
             return
 
+        resources_by_uri = self._get_resources_by_uri()
+        buffer_resources = (resources_by_uri.get(buffer.uri) for buffer in self.model.buffers if buffer.uri is not None)
+        _preload_file_resources(buffer_resources)
         enumerated_buffers = None
         while enumerated_buffers is None:
             enumerated_buffers = enumerate(iter(self.model.buffers))
@@ -635,7 +724,7 @@ class GLTF:
                 if buffer.uri is None:
                     continue
 
-                resource = self.get_resource(buffer.uri)
+                resource = resources_by_uri.get(buffer.uri)
                 if resource is None:
                     raise RuntimeError(f'Missing resource: "{buffer.uri}" (referenced in buffer with index {i})')
                 self.embed_resource(resource)
@@ -648,6 +737,10 @@ class GLTF:
         if self.model.images is None:
             return
 
+        resources_by_uri = self._get_resources_by_uri()
+        image_resources = (resources_by_uri.get(image.uri) for image in self.model.images
+                           if image.uri is not None and image.bufferView is None)
+        _preload_file_resources(image_resources)
         enumerated_images = None
         while enumerated_images is None:
             enumerated_images = enumerate(iter(self.model.images))
@@ -655,7 +748,7 @@ class GLTF:
                 if image.uri is None or image.bufferView is not None:
                     continue
 
-                resource = self.get_resource(image.uri)
+                resource = resources_by_uri.get(image.uri)
                 if resource is None:
                     raise RuntimeError(f'Missing resource: "{image.uri}" (referenced in image with index {i})')
                 self.embed_resource(resource)
@@ -696,40 +789,73 @@ class GLTF:
         glb_buffer = Buffer(byteLength=0)
         self.model.buffers.insert(0, glb_buffer)
         # Increment the buffer index on all existing buffer views by 1 to account for the newly-inserted buffer.
-        if self.model.bufferViews is not None:
-            for buffer_view in self.model.bufferViews:
-                buffer_view.buffer += 1
+        for buffer_view in (self.model.bufferViews or ()):
+            buffer_view.buffer += 1
         return glb_buffer
 
-    def _create_or_extend_glb_resource(self, data: bytearray) -> (GLBResource, int, int):
+    def _create_or_extend_glb_resource(self, data: bytes) -> (GLBResource, int, int):
         bytelen = len(data)
         glb_resource = self.get_glb_resource()
-        if glb_resource is None:
-            offset = 0
-            buffer_bytelen = padbytes(data, 4)
-            glb_resource = GLBResource(data)
-            self.resources.append(glb_resource)
+        pending = self._pending_glb_data
+        if pending is not None:
+            # The data is copied into the GLB resource when leaving _defer_glb_data_merge. Until then, only the offsets
+            # are tracked (any existing data is carried over as the first entry).
+            if glb_resource is None:
+                glb_resource = GLBResource(b'')
+                self.resources.append(glb_resource)
+            elif not pending:
+                pending.append((0, glb_resource.data))
+            last_offset, last_data = pending[-1] if pending else (0, b'')
+            offset = (last_offset + len(last_data) + 3) & ~3
+            buffer_bytelen = (offset + bytelen + 3) & ~3
+            pending.append((offset, data))
         else:
-            # Pad the data in the existing GLBResource to a multiple of 4 bytes
-            existing_data = bytearray(glb_resource.data)
-            offset = padbytes(existing_data, 4)
-            # Merge new data with the data we already have in the existing GLBResource
-            data[0:0] = existing_data
-            # Re-pad the merged byte array
-            buffer_bytelen = padbytes(data, 4)
-            # Update the data on the existing GLBResource
-            glb_resource.data = bytes(data)
+            existing_data = glb_resource.data if glb_resource is not None else b''
+            # The new data is placed after the existing data, aligned to a 4-byte boundary. The merged buffer is
+            # allocated up front with its final (padded) size, so that both the existing and the new data are only
+            # copied once.
+            existing_bytelen = len(existing_data)
+            offset = (existing_bytelen + 3) & ~3
+            buffer_bytelen = (offset + bytelen + 3) & ~3
+            merged = bytearray(buffer_bytelen)
+            merged[:existing_bytelen] = existing_data
+            merged[offset:offset + bytelen] = data
+            if glb_resource is None:
+                glb_resource = GLBResource(merged)
+                self.resources.append(glb_resource)
+            else:
+                # Update the data on the existing GLBResource
+                glb_resource.data = merged
         buffer = self._get_or_create_glb_buffer()
         buffer.byteLength = buffer_bytelen
         # Return the GLBResource, as well as the offset and bytelength of the inserted data
         return glb_resource, offset, bytelen
 
+    @contextmanager
+    def _defer_glb_data_merge(self):
+        """
+        Context manager that defers copying embedded resource data into the GLB resource until the context is exited.
+        Embedding resources one at a time would otherwise copy all of the previously embedded data again for every
+        resource; instead, the merged buffer is allocated once with its final size, and each resource is copied into it
+        exactly once. The GLB resource data must not be accessed until the context is exited.
+        """
+        self._pending_glb_data = []
+        try:
+            yield
+        finally:
+            pending, self._pending_glb_data = self._pending_glb_data, None
+            if pending:
+                last_offset, last_data = pending[-1]
+                merged = bytearray((last_offset + len(last_data) + 3) & ~3)
+                for offset, data in pending:
+                    merged[offset:offset + len(data)] = data
+                self.get_glb_resource().data = merged
+
     def _embed_buffer_views(self, buffer_index, glb_offset):
-        if self.model.bufferViews is not None:
-            for buffer_view in self.model.bufferViews:
-                if buffer_view.buffer == buffer_index:
-                    buffer_view.buffer = 0
-                    buffer_view.byteOffset = (buffer_view.byteOffset or 0) + glb_offset
+        for buffer_view in (self.model.bufferViews or ()):
+            if buffer_view.buffer == buffer_index:
+                buffer_view.buffer = 0
+                buffer_view.byteOffset = (buffer_view.byteOffset or 0) + glb_offset
 
     def _create_embedded_image_buffer_view(self, byte_offset: int, byte_length: int):
         buffer_view = BufferView(buffer=0, byteOffset=byte_offset, byteLength=byte_length)
@@ -752,27 +878,24 @@ class GLTF:
                     # Update any buffers views that point to this buffer
                     self._update_buffer_views_after_embedding_resource(i, offset)
                     # Decrement the buffer index on any buffer views that come after the removed buffer
-                    if self.model.bufferViews is not None:
-                        for buffer_view in self.model.bufferViews:
-                            if buffer_view.buffer > i:
-                                buffer_view.buffer -= 1
-        if self.model.images is not None:
-            for i, image in enumerate(self.model.images):
-                if image.uri in resource_uris:
-                    image.bufferView = self._create_embedded_image_buffer_view(offset, bytelen)
-                    if isinstance(resource, Base64Resource):
-                        image.uri = None
-                        image.mimeType = resource.mime_type
-                    elif isinstance(resource, FileResource):
-                        image.uri = None
-                        image.mimeType = resource.mimetype
+                    for buffer_view in (self.model.bufferViews or ()):
+                        if buffer_view.buffer > i:
+                            buffer_view.buffer -= 1
+        for image in (self.model.images or ()):
+            if image.uri in resource_uris:
+                image.bufferView = self._create_embedded_image_buffer_view(offset, bytelen)
+                if isinstance(resource, Base64Resource):
+                    image.uri = None
+                    image.mimeType = resource.mime_type
+                elif isinstance(resource, FileResource):
+                    image.uri = None
+                    image.mimeType = resource.mimetype
 
     def _update_buffer_views_after_embedding_resource(self, buffer_index: int, offset: int):
-        if self.model.bufferViews is not None:
-            for buffer_view in self.model.bufferViews:
-                if buffer_view.buffer == buffer_index:
-                    buffer_view.buffer = 0
-                    buffer_view.byteOffset = (buffer_view.byteOffset or 0) + offset
+        for buffer_view in (self.model.bufferViews or ()):
+            if buffer_view.buffer == buffer_index:
+                buffer_view.buffer = 0
+                buffer_view.byteOffset = (buffer_view.byteOffset or 0) + offset
 
     def _unembed_glb(self, uri: str) -> None:
         """
@@ -865,7 +988,26 @@ class GLTF:
                 image.bufferView -= 1
 
 
+def _preload_file_resources(resources: Iterable[Optional[GLTFResource]]) -> None:
+    """
+    Loads the given file resources (skipping any that are already loaded, and ignoring other resource types). Since
+    loading resources is I/O bound, multiple resources are loaded concurrently.
+    """
+    to_load = [resource for resource in dict.fromkeys(resources)
+               if isinstance(resource, FileResource) and not resource.loaded]
+    if len(to_load) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_RESOURCE_IO_THREADS, len(to_load))) as executor:
+        for _ in executor.map(lambda resource: resource.load(), to_load):
+            pass
+
+
 def _get_resource(uri, basepath: str, autoload=False) -> Optional[GLTFResource]:
+    # Fast paths for the most common cases (relative file paths and data URIs), which avoid parsing the URI
+    if ':' not in uri and not uri.startswith('//'):
+        return FileResource(unquote(uri), basepath, autoload)
+    if uri.startswith('data:'):
+        return Base64Resource.from_uri(uri)
     scheme, netloc, urlpath, params, query, fragment = urlparse(uri)
     if netloc:
         return ExternalResource(uri)
@@ -2,13 +2,16 @@ import base64
 import mimetypes
 import struct
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from os import path
 from typing import Optional
 from urllib.parse import quote
 from .utils import create_parent_dirs
 
-GLB_JSON_CHUNK_TYPE, = struct.unpack('<I', b'JSON')
-GLB_BINARY_CHUNK_TYPE, = struct.unpack('<I', b'BIN\x00')
+GLB_JSON_CHUNK_TYPE_BYTES = b'JSON'
+GLB_BINARY_CHUNK_TYPE_BYTES = b'BIN\x00'
+GLB_JSON_CHUNK_TYPE, = struct.unpack('<I', GLB_JSON_CHUNK_TYPE_BYTES)
+GLB_BINARY_CHUNK_TYPE, = struct.unpack('<I', GLB_BINARY_CHUNK_TYPE_BYTES)
 
 
 class GLTFResource(ABC):
@@ -17,6 +20,8 @@ class GLTFResource(ABC):
     data may or may not actually be available to be consumed directly.
     """
 
+    __slots__ = ('_uri', '_data')
+
     def __init__(self, uri: Optional[str], data: bytes = None):
         self._uri = uri
         self._data = data
@@ -45,6 +50,8 @@ class FileResource(GLTFResource):
     as file resources.
     """
 
+    __slots__ = ('_filename', '_loaded', '_basepath', '_mimetype')
+
     def __init__(self, filename: str = None, basepath: str = None, autoload=False, data: bytes = None,
                  mimetype: str = None):
         super(FileResource, self).__init__(quote(filename), data)
@@ -76,9 +83,12 @@ class FileResource(GLTFResource):
         if not self._filename:
             raise ValueError("Attempted to load FileResource without filename")
         filename = path.join(self._basepath, self._filename) if self._basepath is not None else self._filename
-        with open(filename, 'rb') as f:
-            self._data = f.read()
-            self._mimetype = self._mimetype or mimetypes.guess_type(filename)[0]
+        # Read the whole file with a single unbuffered read (sized from fstat by the raw file object), rather than going
+        # through a buffered reader that is of no use when reading everything at once.
+        with open(filename, 'rb', buffering=0) as f:
+            self._data = f.readall()
+        if self._mimetype is None:
+            self._mimetype = _guess_mimetype(filename)
         self._loaded = True
 
     def export(self, basepath: str = None) -> None:
@@ -103,6 +113,8 @@ class ExternalResource(GLTFResource):
     importing or saved when exporting.
     """
 
+    __slots__ = ()
+
     def __init__(self, uri: str):
         super(ExternalResource, self).__init__(uri)
 
@@ -127,9 +139,12 @@ class ExternalResource(GLTFResource):
 
 class GLBResource(GLTFResource):
     """
-    Embedded GLTF resource inside a Binary glTF (GLB).
+    Embedded GLTF resource inside a Binary glTF (GLB). Note that after resources have been embedded into it, the data is
+    stored as a (mutable) bytearray rather than bytes, to avoid copying the merged data again.
     """
 
+    __slots__ = ('_resource_type',)
+
     def __init__(self, data: bytes, resource_type: int = GLB_BINARY_CHUNK_TYPE):
         super(GLBResource, self).__init__(None, data)
         self._resource_type = resource_type
@@ -139,7 +154,11 @@ class GLBResource(GLTFResource):
         return self._resource_type
 
     def clone(self) -> 'GLBResource':
-        return GLBResource(self.data, self._resource_type)
+        data = self.data
+        if isinstance(data, bytearray):
+            # Mutable data is copied, so that changes to the data of the clone do not affect the original
+            data = bytearray(data)
+        return GLBResource(data, self._resource_type)
 
 
 class Base64Resource(GLTFResource):
@@ -147,6 +166,8 @@ class Base64Resource(GLTFResource):
     Base64-encoded resource embedded directly inside a JSON-based (non-binary) glTF model.
     """
 
+    __slots__ = ('mime_type',)
+
     def __init__(self, data: bytes, mime_type: str = 'application/octet-stream'):
         encoded_data = base64.b64encode(data).decode('utf-8')
         datauri = f'data:{mime_type};base64,{encoded_data}'
@@ -171,4 +192,18 @@ class Base64Resource(GLTFResource):
         return f'Base64Resource({len(self.data)} bytes)'
 
     def clone(self) -> 'Base64Resource':
-        return Base64Resource(self.data, self.mime_type)
+        # The clone shares the data and the already encoded data URI with this resource, rather than encoding the data
+        # again
+        resource = Base64Resource.__new__(Base64Resource)
+        GLTFResource.__init__(resource, self._uri, self._data)
+        resource.mime_type = self.mime_type
+        return resource
+
+
+@lru_cache(maxsize=1024)
+def _guess_mimetype(filename: str) -> Optional[str]:
+    """
+    Guesses the MIME type of a file based on its filename. Results are cached, since the same files (e.g., textures
+    shared between models) tend to be loaded repeatedly.
+    """
+    return mimetypes.guess_type(filename)[0]
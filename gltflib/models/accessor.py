@@ -1,10 +1,13 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional, List
-from .sparse import Sparse
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
+from .sparse import Sparse
+from ..enums import AccessorType, ComponentType
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Accessor(NamedBaseModel):
@@ -36,3 +39,44 @@ class Accessor(NamedBaseModel):
     max: Optional[List[float]] = None
     min: Optional[List[float]] = None
     sparse: Optional[Sparse] = None
+
+    def element_byte_size(self) -> int:
+        """
+        Returns the size in bytes of a single element (e.g., one VEC3) in this accessor, based on its component type
+        and accessor type. Per the spec, each column of a matrix is aligned to a 4-byte boundary, which only affects
+        MAT2 and MAT3 accessors with 1-byte or 2-byte components.
+        :return: Element size in bytes
+        """
+        component_size = _COMPONENT_TYPE_BYTE_SIZES[self.componentType]
+        columns = _MATRIX_COLUMN_COUNTS.get(self.type)
+        if columns is not None:
+            return columns * ((columns * component_size + 3) & ~3)
+        return component_size * _ACCESSOR_TYPE_COMPONENT_COUNTS[self.type]
+
+
+# Size in bytes of each component type
+_COMPONENT_TYPE_BYTE_SIZES = {
+    ComponentType.BYTE: 1,
+    ComponentType.UNSIGNED_BYTE: 1,
+    ComponentType.SHORT: 2,
+    ComponentType.UNSIGNED_SHORT: 2,
+    ComponentType.UNSIGNED_INT: 4,
+    ComponentType.FLOAT: 4
+}
+
+# Number of components in each accessor type (keyed by the values of AccessorType, since Accessor.type is a string)
+_ACCESSOR_TYPE_COMPONENT_COUNTS = {
+    AccessorType.SCALAR.value: 1,
+    AccessorType.VEC2.value: 2,
+    AccessorType.VEC3.value: 3,
+    AccessorType.VEC4.value: 4,
+    AccessorType.MAT2.value: 4,
+    AccessorType.MAT3.value: 9,
+    AccessorType.MAT4.value: 16
+}
+
+_MATRIX_COLUMN_COUNTS = {
+    AccessorType.MAT2.value: 2,
+    AccessorType.MAT3.value: 3,
+    AccessorType.MAT4.value: 4
+}
@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import List
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
 from .channel import Channel
 from .animation_sampler import AnimationSampler
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Animation(NamedBaseModel):
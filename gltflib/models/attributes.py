@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional
+from .base_model import fast_dict_codec
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Attributes:
@@ -1,6 +1,9 @@
-from dataclasses import dataclass
-from dataclasses_json import dataclass_json
-from typing import Optional, Any
+import copy
+import warnings
+from dataclasses import asdict, dataclass, fields, is_dataclass, MISSING
+from dataclasses_json import dataclass_json, DataClassJsonMixin
+from typing import Optional, Any, Callable, List, get_type_hints
+from ..utils import without_none
 
 
 @dataclass_json
@@ -15,3 +18,246 @@ class BaseModel:
     """
     extensions: Optional[Any] = None
     extras: Optional[Any] = None
+
+
+def fast_dict_codec(cls):
+    """
+    Class decorator that replaces the from_dict and to_dict methods provided by dataclasses_json with versions that do
+    not inspect the type annotations on every call. Instead, the methods are generated as straight-line source code
+    for each class, with the type-specific logic for every field emitted inline, and compiled once when the class is
+    decorated. The generated methods behave like the ones provided by dataclasses_json: scalar values are coerced to
+    the declared field type (e.g., integers in a float field become floats), missing fields are set to their default
+    values, and a RuntimeWarning is emitted for any required fields that are missing.
+
+    Fields whose type is itself a model (or a list of models) are decoded and encoded using that model's own from_dict
+    and to_dict methods, so every model class must be decorated. The decorator must be applied on top of
+    dataclass_json, so that the remaining methods (to_json, from_json, schema) remain available. The generated methods
+    only handle the fields of the decorated class itself: when inherited by a subclass (which may declare additional
+    fields), they fall back to the implementations provided by dataclasses_json.
+
+    In addition, a _to_json_dict method is added, which encodes the model to a dictionary suitable for serializing to
+    glTF JSON in a single pass: properties set to None are omitted (recursively), equivalent to del_none(asdict(model)).
+    A __deepcopy__ method is also generated, so that copying a model (e.g., when cloning a GLTF instance) does not go
+    through the generic reduce protocol for every nested object.
+    """
+    types = get_type_hints(cls)
+    init_fields = [field for field in fields(cls) if field.init]
+    cls.from_dict = classmethod(_generate_from_dict(cls, types, init_fields))
+    cls.to_dict = _generate_to_dict(cls, types, init_fields)
+    cls._to_json_dict = _generate_to_json_dict(cls, types, init_fields)
+    cls.__deepcopy__ = _generate_deepcopy(cls, types, init_fields)
+    return cls
+
+
+_ATOMIC_TYPES = (int, float, str, bool)
+
+
+def _generate_from_dict(cls, types, init_fields) -> Callable:
+    """
+    Generates the from_dict method for the given model class. Rather than looping over the fields and calling a decoder
+    function for each one, the decoding logic for every field is emitted inline.
+    """
+    namespace = {'MISSING': MISSING, '_warn_missing': _warn_missing, '_cls': cls,
+                 '_from_dict': DataClassJsonMixin.from_dict.__func__}
+    lines = ['def from_dict(klass, kvs, *, infer_missing=False):',
+             '    if isinstance(kvs, klass):',
+             '        return kvs',
+             '    if klass is not _cls:',
+             '        return _from_dict(klass, kvs, infer_missing=infer_missing)',
+             '    get = kvs.get']
+    for field in init_fields:
+        name = field.name
+        var = f'_v_{name}'
+        lines.append(f'    {var} = get({name!r}, MISSING)')
+        lines.append(f'    if {var} is MISSING:')
+        if field.default_factory is not MISSING:
+            namespace[f'_factory_{name}'] = field.default_factory
+            lines.append(f'        {var} = _factory_{name}()')
+        else:
+            namespace[f'_default_{name}'] = None if field.default is MISSING else field.default
+            lines.append(f'        {var} = _default_{name}')
+        decoder = _decoder_source(_unwrap_optional(types[name]), var, f'_type_{name}', namespace)
+        required = not _is_optional(types[name])
+        if required:
+            lines.append(f'    if {var} is None:')
+            lines.append(f'        _warn_missing({name!r}, klass)')
+            if decoder is not None:
+                lines.append(f'    else:')
+                lines.append(f'        {decoder}')
+        elif decoder is not None:
+            lines.append(f'    if {var} is not None:')
+            lines.append(f'        {decoder}')
+    kwargs = ', '.join(f'{field.name}=_v_{field.name}' for field in init_fields)
+    lines.append(f'    return klass({kwargs})')
+    return _compile(cls, 'from_dict', lines, namespace)
+
+
+def _decoder_source(type_, var: str, type_name: str, namespace: dict) -> Optional[str]:
+    """
+    Returns a statement that decodes the (non-None) value stored in the given variable from its JSON representation,
+    or None if the value can be used as is. Any types referenced by the statement are added to the namespace.
+    """
+    if type_ in _ATOMIC_TYPES:
+        namespace[type_name] = type_
+        return f'{var} = {var} if isinstance({var}, {type_name}) else {type_name}({var})'
+    if is_dataclass(type_):
+        namespace[type_name] = type_
+        return f'{var} = {type_name}.from_dict({var}, infer_missing=infer_missing)'
+    if getattr(type_, '__origin__', None) in (list, List):
+        item_type = type_.__args__[0]
+        namespace[type_name] = item_type
+        if item_type in _ATOMIC_TYPES:
+            return f'{var} = [item if isinstance(item, {type_name}) else {type_name}(item) for item in {var}]'
+        if is_dataclass(item_type):
+            return f'{var} = [{type_name}.from_dict(item, infer_missing=infer_missing) for item in {var}]'
+        return f'{var} = list({var})'
+    return None
+
+
+def _warn_missing(name: str, klass) -> None:
+    warnings.warn(f"'NoneType' object value of non-optional type {name} detected when decoding {klass.__name__}.",
+                  RuntimeWarning)
+
+
+def _generate_to_dict(cls, types, init_fields) -> Callable:
+    """
+    Generates the to_dict method for the given model class. Each field is read by attribute name directly (rather than
+    through getattr), and encoded inline.
+    """
+    namespace = {'_deepcopy': copy.deepcopy, '_cls': cls, '_to_dict': DataClassJsonMixin.to_dict}
+    lines = ['def to_dict(self, encode_json=False):',
+             '    if self.__class__ is not _cls:',
+             '        return _to_dict(self, encode_json=encode_json)']
+    for field in init_fields:
+        name = field.name
+        var = f'_v_{name}'
+        lines.append(f'    {var} = self.{name}')
+        encoder = _encoder_source(_unwrap_optional(types[name]), var)
+        if encoder is not None:
+            lines.append(f'    if {var} is not None:')
+            lines.append(f'        {encoder}')
+    items = ', '.join(f'{field.name!r}: _v_{field.name}' for field in init_fields)
+    lines.append(f'    return {{{items}}}')
+    return _compile(cls, 'to_dict', lines, namespace)
+
+
+def _generate_to_json_dict(cls, types, init_fields) -> Callable:
+    """
+    Generates the _to_json_dict method for the given model class, which omits properties set to None (recursively).
+    """
+    namespace = {'_without_none': without_none, '_cls': cls, '_asdict': asdict}
+    lines = ['def _to_json_dict(self):',
+             '    if self.__class__ is not _cls:',
+             '        return _without_none(_asdict(self))',
+             '    result = {}']
+    for field in init_fields:
+        name = field.name
+        var = f'_v_{name}'
+        lines.append(f'    {var} = self.{name}')
+        lines.append(f'    if {var} is not None:')
+        lines.append(f'        result[{name!r}] = {_json_encoder_source(_unwrap_optional(types[name]), var)}')
+    lines.append('    return result')
+    return _compile(cls, '_to_json_dict', lines, namespace)
+
+
+def _generate_deepcopy(cls, types, init_fields) -> Callable:
+    """
+    Generates the __deepcopy__ method for the given model class. Values of atomic types are immutable and are shared
+    with the copy, and lists are copied item by item, so copy.deepcopy only needs to be called for nested models and
+    values of other types (e.g., extensions and extras). Instances of subclasses, and instances with attributes other
+    than the fields of the class, are copied attribute by attribute instead (see _deepcopy_attributes).
+    """
+    namespace = {'_deepcopy': copy.deepcopy, '_atomic_types': frozenset(_ATOMIC_TYPES), '_cls': cls,
+                 '_deepcopy_attributes': _deepcopy_attributes}
+    lines = ['def __deepcopy__(self, memo):',
+             f'    if self.__class__ is not _cls or len(self.__dict__) != {len(init_fields)}:',
+             '        return _deepcopy_attributes(self, memo)',
+             '    result = object.__new__(_cls)',
+             '    memo[id(self)] = result']
+    for field in init_fields:
+        name = field.name
+        var = f'_v_{name}'
+        lines.append(f'    {var} = self.{name}')
+        lines.append(f'    result.{name} = {var} if {var} is None else '
+                     f'{_copy_source(_unwrap_optional(types[name]), var)}')
+    lines.append('    return result')
+    return _compile(cls, '__deepcopy__', lines, namespace)
+
+
+def _deepcopy_attributes(obj, memo):
+    """
+    Deep copies a model by copying each of its instance attributes, which is what copy.deepcopy does for objects that do
+    not define __deepcopy__.
+    """
+    result = object.__new__(obj.__class__)
+    memo[id(obj)] = result
+    result.__dict__.update((name, copy.deepcopy(value, memo)) for name, value in obj.__dict__.items())
+    return result
+
+
+def _encoder_source(type_, var: str) -> Optional[str]:
+    """
+    Returns a statement that encodes the (non-None) value stored in the given variable to its dictionary
+    representation, or None if the value can be used as is.
+    """
+    if type_ in _ATOMIC_TYPES:
+        return None
+    if is_dataclass(type_):
+        return f'{var} = {var}.to_dict(encode_json)'
+    if getattr(type_, '__origin__', None) in (list, List):
+        item_type = type_.__args__[0]
+        if item_type in _ATOMIC_TYPES:
+            return f'{var} = list({var})'
+        if is_dataclass(item_type):
+            return f'{var} = [item.to_dict(encode_json) for item in {var}]'
+    return f'{var} = _deepcopy({var})'
+
+
+def _json_encoder_source(type_, var: str) -> str:
+    """
+    Returns an expression that encodes the (non-None) value stored in the given variable for serializing to JSON with
+    properties set to None omitted.
+    """
+    if type_ in _ATOMIC_TYPES:
+        return var
+    if is_dataclass(type_):
+        return f'{var}._to_json_dict()'
+    if getattr(type_, '__origin__', None) in (list, List):
+        item_type = type_.__args__[0]
+        if item_type in _ATOMIC_TYPES:
+            return var
+        if is_dataclass(item_type):
+            return f'[item._to_json_dict() for item in {var}]'
+    return f'_without_none({var})'
+
+
+def _copy_source(type_, var: str) -> str:
+    """Returns an expression that deep copies the (non-None) value stored in the given variable."""
+    if type_ in _ATOMIC_TYPES:
+        return f'{var} if {var}.__class__ in _atomic_types else _deepcopy({var}, memo)'
+    if getattr(type_, '__origin__', None) in (list, List):
+        item_type = type_.__args__[0]
+        if item_type in _ATOMIC_TYPES:
+            return f'[item if item.__class__ in _atomic_types else _deepcopy(item, memo) for item in {var}]'
+        if is_dataclass(item_type):
+            return f'[_deepcopy(item, memo) for item in {var}]'
+    return f'_deepcopy({var}, memo)'
+
+
+def _compile(cls, name: str, lines: List[str], namespace: dict) -> Callable:
+    """Compiles the given lines of generated source code, and returns the function with the given name."""
+    exec('\n'.join(lines), namespace)
+    function = namespace[name]
+    function.__qualname__ = f'{cls.__qualname__}.{name}'
+    return function
+
+
+def _is_optional(type_) -> bool:
+    return type_ is Any or type(None) in getattr(type_, '__args__', ())
+
+
+def _unwrap_optional(type_):
+    args = getattr(type_, '__args__', ())
+    if type(None) in args and len(args) == 2:
+        return next(arg for arg in args if arg is not type(None))
+    return type_
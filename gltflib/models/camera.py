@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
 from .orthographic_camera_info import OrthographicCameraInfo
 from .perspective_camera_info import PerspectiveCameraInfo
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Camera(NamedBaseModel):
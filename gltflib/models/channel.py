@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 from .target import Target
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Channel(BaseModel):
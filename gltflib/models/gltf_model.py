@@ -1,12 +1,11 @@
-import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from dataclasses_json import DataClassJsonMixin
 from typing import List, Optional
-from ..utils import del_none
+from ..utils import json_loads, json_dumps, COMPACT_SEPARATORS
 from .accessor import Accessor
 from .animation import Animation
 from .asset import Asset
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 from .buffer import Buffer
 from .buffer_view import BufferView
 from .camera import Camera
@@ -20,6 +19,7 @@ from .skin import Skin
 from .texture import Texture
 
 
+@fast_dict_codec
 @dataclass
 class GLTFModel(DataClassJsonMixin, BaseModel):
     accessors: Optional[List[Accessor]] = None
@@ -40,6 +40,18 @@ class GLTFModel(DataClassJsonMixin, BaseModel):
     extensionsRequired: Optional[List[str]] = None
     extensionsUsed: Optional[List[str]] = None
 
-    def to_json(self, **kwargs):
-        data = del_none(asdict(self))
-        return json.dumps(data, **kwargs)
+    @classmethod
+    def from_json(cls, s, *, infer_missing=False, **kwargs) -> 'GLTFModel':
+        if kwargs:
+            # Parser-specific arguments (e.g., parse_float) are only supported by the standard library json module
+            return super().from_json(s, infer_missing=infer_missing, **kwargs)
+        return cls.from_dict(json_loads(s), infer_missing=infer_missing)
+
+    def to_json(self, **kwargs) -> str:
+        return self.to_json_bytes(**kwargs).decode('utf-8')
+
+    def to_json_bytes(self, **kwargs) -> bytes:
+        if kwargs.get('indent') is None:
+            # Emit compact JSON (without whitespace after separators) unless pretty-printed output is requested
+            kwargs.setdefault('separators', COMPACT_SEPARATORS)
+        return json_dumps(self._to_json_dict(), **kwargs)
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Image(NamedBaseModel):
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional, List
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
 from .normal_texture_info import NormalTextureInfo
 from .occlusion_texture_info import OcclusionTextureInfo
@@ -8,6 +9,7 @@ from .pbr_metallic_roughness import PBRMetallicRoughness
 from .texture_info import TextureInfo
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Material(NamedBaseModel):
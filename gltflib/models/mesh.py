@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import List, Optional
+from .base_model import fast_dict_codec
 from .named_base_model import NamedBaseModel
 from .primitive import Primitive
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Mesh(NamedBaseModel):
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class NamedBaseModel(BaseModel):
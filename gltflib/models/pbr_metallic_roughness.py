@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
 from typing import Optional, List
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 from .texture_info import TextureInfo
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class PBRMetallicRoughness(BaseModel):
@@ -2,9 +2,10 @@ from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json
 from typing import Optional, List
 from .attributes import Attributes
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Primitive(BaseModel):
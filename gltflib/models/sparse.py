@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 from .sparse_indices import SparseIndices
 from .sparse_values import SparseValues
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class Sparse(BaseModel):
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from dataclasses_json import dataclass_json
-from .base_model import BaseModel
+from .base_model import BaseModel, fast_dict_codec
 
 
+@fast_dict_codec
 @dataclass_json
 @dataclass
 class SparseValues(BaseModel):
@@ -1,3 +1,3 @@
 from .data_utils import padbytes
-from .file_utils import create_parent_dirs
-from .json_utils import del_none
+from .file_utils import create_parent_dirs, write_buffers
+from .json_utils import del_none, without_none, json_loads, json_dumps, COMPACT_SEPARATORS
@@ -1,6 +1,10 @@
 def padbytes(arr: bytearray, alignment: int, fillchar: bytes = b'\x00', offset: int = 0) -> int:
     arrlen = len(arr)
-    padlen = (alignment - ((arrlen + offset) % alignment)) % alignment
+    if alignment & (alignment - 1) == 0:
+        # Alignment is a power of two (typically 4), so the padding can be computed with a bitmask
+        padlen = -(arrlen + offset) & (alignment - 1)
+    else:
+        padlen = (alignment - ((arrlen + offset) % alignment)) % alignment
     if padlen > 0:
         arr.extend(padlen * fillchar)
         return arrlen + padlen
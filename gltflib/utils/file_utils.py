@@ -1,5 +1,8 @@
+import io
+import os
 from os import path
 from pathlib import Path
+from typing import BinaryIO, List, Union
 
 
 def create_parent_dirs(filename: str) -> None:
@@ -9,3 +12,44 @@ def create_parent_dirs(filename: str) -> None:
     :param filename: Path to a file (either relative or absolute)
     """
     Path(path.dirname(filename)).mkdir(parents=True, exist_ok=True)
+
+
+def write_buffers(stream: BinaryIO, buffers: List[Union[bytes, bytearray, memoryview]]) -> None:
+    """
+    Writes a sequence of buffers to a binary stream. If the stream is a regular file object and the platform supports
+    it, the buffers are written with a gather write (os.writev), which avoids a separate system call (and any copying
+    into the stream's write buffer) for each buffer. Otherwise, the buffers are written one at a time. Streams that wrap
+    a file (e.g., gzip.GzipFile) are always written through the stream itself, since writing to their file descriptor
+    directly would bypass them.
+    :param stream: Binary stream
+    :param buffers: Buffers to write (in order)
+    """
+    fd = None
+    if isinstance(stream, _FILE_STREAM_TYPES) and hasattr(os, 'writev'):
+        try:
+            fd = stream.fileno()
+        except (OSError, ValueError):
+            # The stream is not backed by a file descriptor (e.g., a BufferedWriter wrapping a BytesIO)
+            pass
+    if fd is None:
+        for buffer in buffers:
+            stream.write(buffer)
+        return
+    # Anything already buffered by the stream must be written before writing to the file descriptor directly
+    stream.flush()
+    views = [view for view in (memoryview(buffer).cast('B') for buffer in buffers) if len(view) > 0]
+    while views:
+        # writev may write fewer bytes than requested (and is limited in how many buffers it accepts per call), so any
+        # remaining data is written with additional calls
+        written = os.writev(fd, views[:_MAX_WRITEV_BUFFERS])
+        while views and written >= len(views[0]):
+            written -= len(views.pop(0))
+        if written:
+            views[0] = views[0][written:]
+
+
+# Stream types that write directly to their file descriptor, which can therefore be used for gather writes
+_FILE_STREAM_TYPES = (io.FileIO, io.BufferedWriter, io.BufferedRandom)
+
+# Number of buffers passed to each os.writev call (IOV_MAX is at least 1024 on the platforms that support writev)
+_MAX_WRITEV_BUFFERS = 1024
@@ -1,3 +1,90 @@
+import json
+import math
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Separators that produce the most compact output from json.dumps. These are the same separators that orjson uses.
+COMPACT_SEPARATORS = (',', ':')
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document. Uses orjson if it is installed, otherwise falls back to the json module from the standard
+    library. The standard library is also used if orjson rejects the document, since orjson is stricter about what it
+    accepts (e.g., NaN and Infinity, or strings containing unpaired surrogate escapes, as written by json.dumps). Note
+    that orjson only parses integers within the 64-bit range (unsigned for positive values, signed for negative values)
+    as int; integers outside that range are parsed as float, and may therefore lose precision.
+    :param data: JSON document (either str or UTF-8 encoded bytes)
+    :return: Parsed data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, **kwargs) -> bytes:
+    """
+    Serializes an object to UTF-8 encoded JSON. Uses orjson if it is installed and the requested formatting is supported
+    by orjson (i.e., no keyword arguments, only compact separators, or an indent of 2 spaces, each optionally with
+    sorted keys). Otherwise, any keyword arguments are forwarded to json.dumps from the standard library.
+
+    The output of orjson represents the same data as the output of json.dumps, but is not identical to it: non-ASCII
+    characters are written as UTF-8 rather than escaped, and some floats are formatted differently (e.g., 1e-7 rather
+    than 1e-07). The standard library is used if orjson cannot serialize the object (e.g., extras containing
+    dictionaries with non-string keys, or integers outside the 64-bit range), and for objects containing non-finite
+    floats, which orjson would write as null (whereas json.dumps writes NaN, Infinity, and -Infinity).
+    :param obj: Object to serialize
+    :return: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = _get_orjson_option(kwargs)
+        if option is not None:
+            try:
+                data = orjson.dumps(obj, option=option)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                # Non-finite floats are written as null, so the object only needs to be checked if the output has any
+                if b'null' not in data or not _contains_non_finite_float(obj):
+                    return data
+    return json.dumps(obj, **kwargs).encode('utf-8')
+
+
+def _contains_non_finite_float(value: Any) -> bool:
+    """Returns whether the given value contains any NaN or infinite floats (in nested dictionaries and lists)."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_non_finite_float(item) for item in value)
+    return False
+
+
+def _get_orjson_option(kwargs) -> Optional[int]:
+    """
+    Returns the orjson option flags that produce the same formatting (separators, indentation, and key order) as
+    json.dumps with the given keyword arguments, or None if the formatting is not supported by orjson.
+    """
+    option = 0
+    if kwargs.get('sort_keys'):
+        option |= orjson.OPT_SORT_KEYS
+    kwargs = {key: value for key, value in kwargs.items() if key != 'sort_keys'}
+    if not kwargs or kwargs == {'separators': COMPACT_SEPARATORS}:
+        return option
+    if kwargs == {'indent': 2}:
+        return option | orjson.OPT_INDENT_2
+    return None
+
+
 def del_none(d):
     """
     Delete keys with the value ``None`` in a dictionary, recursively.
@@ -19,3 +106,16 @@ def del_none(d):
                 if isinstance(item, dict):
                     del_none(item)
     return d  # For convenience
+
+
+def without_none(value):
+    """
+    Returns a copy of the given value with any keys with the value ``None`` removed from dictionaries, recursively. The
+    result is the same as calling ``del_none`` on a deep copy of the value, but only dictionaries and lists are copied
+    (other values are shared with the input), and the input is traversed only once.
+    """
+    if isinstance(value, dict):
+        return {key: without_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [without_none(item) if isinstance(item, dict) else item for item in value]
+    return value
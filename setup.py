@@ -5,7 +5,7 @@ import io
 import os
 import sys
 from shutil import rmtree
-from setuptools import find_packages, setup, Command
+from setuptools import setup, Command
 
 here = os.path.abspath(os.path.dirname(__file__))
 
@@ -24,7 +24,9 @@ REQUIRED = [
 ]
 
 # Optional packages
-EXTRAS = {}
+EXTRAS = {
+    'orjson': ['orjson>=3.0.0']
+}
 
 # Load version from gltflib/__version__.py
 __version__ = None
@@ -83,7 +85,7 @@ setup(
     author=AUTHOR,
     python_requires=REQUIRES_PYTHON,
     url=URL,
-    packages=find_packages(exclude=["tests"]),
+    packages=['gltflib', 'gltflib.enums', 'gltflib.models', 'gltflib.utils'],
     install_requires=REQUIRED,
     extras_require=EXTRAS,
     include_package_data=True,
@@ -1,12 +1,16 @@
+import io
 import json
+import os
 import tempfile
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from os import path
-from pprint import pformat
 from unittest import TestCase
 from pathlib import Path
-from ..util import setup_temp_dir, SAMPLES_DIR, TEMP_DIR
-from gltflib import GLTF
+from typing import Tuple
+from ..util import SAMPLES_DIR, TEMP_DIR
+from gltflib import GLTF, GLTFModel
 
 
 # If set to True, for any models that fail to pass the equality check, this will automatically launch kdiff3 to compare
@@ -21,7 +25,7 @@ class TestRoundtrip(TestCase):
     This test class loads each model (including all variants: glTF, glTF-Binary, glTF-Embedded, etc.) from the original
     glTF-Sample-Models repository, then performs the following steps:
 
-      1. Export the model (without any changes) to a temporary location
+      1. Export the model (without any changes) to a temporary location (or, for glTF-Binary, to an in-memory stream)
       2. Load the exported copy
       3. Ensure that the parsed model from the exported copy is equal to the parsed model from the original sample
 
@@ -33,60 +37,96 @@ class TestRoundtrip(TestCase):
         print()
         print('Running round-trip tests:')
         print()
-        setup_temp_dir()
 
     def setUp(self):
         self.maxDiff = None
 
-    def _get_model_index(self):
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _get_model_index(cls):
+        # The model index is only read (never modified), so it is parsed once and shared by all test methods
         with open(path.join(SAMPLES_DIR, 'model-index.json')) as f:
             return json.load(f)
 
     def test_roundtrip(self):
         """Ensures all sample models remain unchanged after loading, saving, and loading again via the library"""
 
-        # Read the model-index.json file to get a listing of all sample models
-        for info in self._get_model_index():
-            model_name = info['name']
-            variants = info['variants']
-
-            # Test each available variant of the model (glTF, glTF-Binary, glTF-Embedded, and glTF-Draco)
-            for variant in variants:
-                basename = variants[variant]
+        # Read the model-index.json file to get a listing of all sample models, and collect each available variant of
+        # each model (glTF, glTF-Binary, glTF-Embedded, and glTF-Draco)
+        variants = [(info['name'], variant, basename)
+                    for info in self._get_model_index()
+                    for variant, basename in info['variants'].items()]
+
+        # Create the output directories for all exported copies up front (glTF-Binary copies are kept in memory)
+        for output_dir in {path.join(TEMP_DIR, model_name, variant)
+                           for model_name, variant, _ in variants if variant != 'glTF-Binary'}:
+            os.makedirs(output_dir, exist_ok=True)
+
+        # Each variant is independent of the others, so the round trips are performed in parallel in separate processes.
+        # Results are returned in order, and checked here in the main process.
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_roundtrip, *zip(*variants))
+            for (model_name, variant, basename), (original_model, roundtrip_model) in zip(variants, results):
                 original_filename = path.join(SAMPLES_DIR, model_name, variant, basename)
                 abspath = path.abspath(original_filename)
 
                 # Print the absolute path of the current variant we're testing
                 print(abspath)
 
-                # Parse the original model
-                original_model = GLTF.load(original_filename)
-
-                # Export a copy of the parsed model to a temporary location
-                output_filename = path.join(TEMP_DIR, model_name, variant, basename)
-                original_model.export(output_filename)
-
-                # Parse the exported copy
-                roundtrip_model = GLTF.load(output_filename)
-
                 # In debug mode, open a diff viewer if the original model is not equivalent to the roundtrip version
-                if DEBUG and original_model.model != roundtrip_model.model:
+                if DEBUG and original_model != roundtrip_model:
                     self._launch_diff_viewer(original_filename, variant, original_model, roundtrip_model)
 
                 # Fail the test if the original model doesn't match the roundtrip model
-                self.assertEqual(original_model.model, roundtrip_model.model)
+                self.assertEqual(original_model, roundtrip_model)
 
-    def _launch_diff_viewer(self, filename: str, variant: str, model_1: GLTF, model_2: GLTF):
+    def _launch_diff_viewer(self, filename: str, variant: str, model_1: GLTFModel, model_2: GLTFModel):
         """Helper method to open a diff viewer if the models don't match"""
         p = Path(filename)
         basename = p.stem
         ext = p.suffix
-        v1 = pformat(model_1.model.to_dict())
-        v2 = pformat(model_2.model.to_dict())
-        with tempfile.NamedTemporaryFile(mode='w+', prefix=f"{basename}_{variant}_original_", suffix=ext) as f1:
+        v1 = model_1.to_json_bytes(indent=2, sort_keys=True)
+        v2 = model_2.to_json_bytes(indent=2, sort_keys=True)
+        with tempfile.NamedTemporaryFile(mode='wb', prefix=f"{basename}_{variant}_original_", suffix=ext) as f1:
             f1.write(v1)
             f1.flush()
-            with tempfile.NamedTemporaryFile(mode='w+', prefix=f"{basename}_{variant}_roundtrip_", suffix=ext) as f2:
+            with tempfile.NamedTemporaryFile(mode='wb', prefix=f"{basename}_{variant}_roundtrip_", suffix=ext) as f2:
                 f2.write(v2)
                 f2.flush()
                 subprocess.run(['kdiff3', f1.name, f2.name])
+
+
+def _roundtrip(model_name: str, variant: str, basename: str) -> Tuple[GLTFModel, GLTFModel]:
+    """
+    Loads the given variant of a sample model, exports it to a temporary location, and loads the exported copy. Returns
+    the parsed original model and the parsed roundtrip model. This runs in a worker process, so it is defined at the
+    module level (and the models are returned rather than compared here). Any errors are re-raised with the path of the
+    sample model, since the traceback from the worker process alone does not show which model failed.
+    """
+    original_filename = path.join(SAMPLES_DIR, model_name, variant, basename)
+    try:
+        return _roundtrip_file(original_filename, model_name, variant, basename)
+    except Exception as e:
+        raise RuntimeError(f'Round trip failed for {path.abspath(original_filename)}: {e!r}') from e
+
+
+def _roundtrip_file(original_filename: str, model_name: str, variant: str, basename: str) \
+        -> Tuple[GLTFModel, GLTFModel]:
+    # Parse the original model
+    original_model = GLTF.load(original_filename)
+
+    if variant == 'glTF-Binary':
+        # Write the exported copy to memory and parse it from there, so that the (potentially large) binary chunk does
+        # not need to be written to and read back from the filesystem. Only the models are compared, so there are no
+        # external file resources to save along with the exported copy.
+        stream = io.BytesIO()
+        original_model.write_glb(stream, save_file_resources=False)
+        stream.seek(0)
+        roundtrip_model = GLTF.read_glb(stream)
+    else:
+        # Export a copy of the parsed model (along with its file resources) to a temporary location, and parse the
+        # exported copy
+        output_filename = path.join(TEMP_DIR, model_name, variant, basename)
+        original_model.export(output_filename)
+        roundtrip_model = GLTF.load(output_filename)
+    return original_model.model, roundtrip_model.model
@@ -1,26 +1,63 @@
-import os
-import json
+import gzip
+import io
+import shutil
+import tempfile
 import base64
+from functools import lru_cache
 from os import path
 from unittest import TestCase
-from ..util import sample, custom_sample, setup_temp_dir, SAMPLES_DIR, TEMP_DIR
+from unittest.mock import patch
+from ..util import sample, custom_sample, SAMPLES_DIR, TEMP_DIR
 from gltflib import (
     GLTF, GLTFModel, Accessor, Asset, FileResource, ExternalResource, Buffer, BufferView, Image, GLBResource,
     Base64Resource, GLB_BINARY_CHUNK_TYPE, Sparse, SparseIndices, SparseValues)
+from gltflib.utils import json_loads
 
 
 class TestGLTF(TestCase):
-    @classmethod
-    def setUpClass(cls):
-        setup_temp_dir()
+    def setUp(self):
+        # Each test writes to its own directory, so that tests are isolated from files exported by other tests
+        self.temp_dir = tempfile.mkdtemp(dir=TEMP_DIR)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def assert_gltf_files_equal(self, filename1, filename2):
-        """Helper method for asserting two GLTF files contain equivalent JSON"""
-        with open(filename1, 'r') as f1:
-            data1 = json.loads(f1.read())
-        with open(filename2, 'r') as f2:
-            data2 = json.loads(f2.read())
-        self.assertDictEqual(data1, data2)
+        """
+        Helper method for asserting two GLTF files contain equivalent JSON. Files with identical contents are equivalent
+        without having to parse them.
+        """
+        data1 = self._read_file(filename1)
+        data2 = self._read_file(filename2)
+        if data1 != data2:
+            self.assertDictEqual(json_loads(data1), json_loads(data2))
+
+    def _load_sample(self, model, load_file_resources=False) -> GLTF:
+        """
+        Helper method for loading a sample model (in glTF format). Each sample is only parsed once per test run, and
+        every test receives its own clone, so tests are free to modify the returned instance.
+        """
+        return self._parse_sample(model, load_file_resources).clone()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _parse_sample(model, load_file_resources) -> GLTF:
+        return GLTF.load(sample(model), load_file_resources=load_file_resources)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _read_bytes(filename):
+        """
+        Helper method for reading the contents of a sample file. The sample files are never modified by the tests, so
+        each one is only read from disk once (this must not be used for files written by the tests).
+        """
+        return TestGLTF._read_file(filename)
+
+    @staticmethod
+    def _read_file(filename) -> bytes:
+        """Helper method for reading the entire contents of a file with a single unbuffered read."""
+        with open(filename, 'rb', buffering=0) as f:
+            return f.readall()
 
     def test_load(self):
         """Basic test ensuring the class can successfully load a minimal GLTF 2.0 file."""
@@ -35,7 +72,7 @@ class TestGLTF(TestCase):
         """Basic test ensuring the class can successfully save a minimal GLTF 2.0 file."""
         # Arrange
         gltf = GLTF(model=GLTFModel(asset=Asset(version="2.0")))
-        filename = path.join(TEMP_DIR, 'minimal.gltf')
+        filename = path.join(self.temp_dir, 'minimal.gltf')
 
         # Act
         gltf.export(filename)
@@ -47,7 +84,7 @@ class TestGLTF(TestCase):
         """Create directories if necessary when exporting a model to a directory that does not exist"""
         # Arrange
         gltf = GLTF(model=GLTFModel(asset=Asset(version="2.0")))
-        filename = path.join(TEMP_DIR, 'nested', 'directory', 'minimal.gltf')
+        filename = path.join(self.temp_dir, 'nested', 'directory', 'minimal.gltf')
 
         # Act
         gltf.export(filename)
@@ -58,7 +95,7 @@ class TestGLTF(TestCase):
     def test_load_file_resource(self):
         """External files referenced in a glTF model should be loaded as FileResource"""
         # Act
-        gltf = GLTF.load(sample('TriangleWithoutIndices'))
+        gltf = self._load_sample('TriangleWithoutIndices')
 
         # Assert
         self.assertIsInstance(gltf.resources, list)
@@ -69,7 +106,7 @@ class TestGLTF(TestCase):
     def test_load_file_resource_no_autoload(self):
         """File resource contents should not be autoloaded by default"""
         # Act
-        gltf = GLTF.load(sample('TriangleWithoutIndices'))
+        gltf = self._load_sample('TriangleWithoutIndices')
         resource = gltf.get_resource('triangleWithoutIndices.bin')
 
         # Assert
@@ -80,26 +117,24 @@ class TestGLTF(TestCase):
     def test_load_file_resource_with_autoload(self):
         """When load_file_resources is true, file resource contents should be autoloaded"""
         # Act
-        gltf = GLTF.load(sample('TriangleWithoutIndices'), load_file_resources=True)
+        gltf = self._load_sample('TriangleWithoutIndices', load_file_resources=True)
         resource = gltf.get_resource('triangleWithoutIndices.bin')
 
         # Assert
         self.assertIsInstance(resource, FileResource)
         self.assertTrue(resource.loaded)
-        with open(path.join(SAMPLES_DIR, 'TriangleWithoutIndices/glTF/triangleWithoutIndices.bin'), 'rb') as f:
-            data = f.read()
+        data = self._read_bytes(path.join(SAMPLES_DIR, 'TriangleWithoutIndices/glTF/triangleWithoutIndices.bin'))
         self.assertEqual(data, resource.data)
 
     def test_load_image_resources(self):
         """Ensure image resources are loaded"""
         # Act
-        gltf = GLTF.load(sample('BoxTextured'), load_file_resources=True)
+        gltf = self._load_sample('BoxTextured', load_file_resources=True)
         texture = gltf.get_resource('CesiumLogoFlat.png')
 
         # Assert
         self.assertIsInstance(texture, FileResource)
-        with open(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'), 'rb') as f:
-            texture_data = f.read()
+        texture_data = self._read_bytes(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'))
         self.assertEqual(texture_data, texture.data)
 
     def test_load_external_resources(self):
@@ -143,16 +178,15 @@ class TestGLTF(TestCase):
         resource = FileResource('buffer.bin', data=data)
         model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='buffer.bin', byteLength=bytelen)])
         gltf = GLTF(model=model, resources=[resource])
-        filename = path.join(TEMP_DIR, 'sample.gltf')
+        filename = path.join(self.temp_dir, 'sample.gltf')
 
         # Act
         gltf.export(filename, save_file_resources=True)
 
         # Assert
-        resource_filename = path.join(TEMP_DIR, 'buffer.bin')
+        resource_filename = path.join(self.temp_dir, 'buffer.bin')
         self.assertTrue(path.exists(resource_filename))
-        with open(resource_filename, 'rb') as f:
-            self.assertEqual(data, f.read())
+        self.assertEqual(data, self._read_file(resource_filename))
 
     def test_export_file_resources_creates_missing_parent_dirs(self):
         """
@@ -164,31 +198,28 @@ class TestGLTF(TestCase):
         resource = FileResource('subdir/buffer.bin', data=data)
         model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='subdir/buffer.bin', byteLength=bytelen)])
         gltf = GLTF(model=model, resources=[resource])
-        filename = path.join(TEMP_DIR, 'sample.gltf')
+        filename = path.join(self.temp_dir, 'sample.gltf')
 
         # Act
         gltf.export(filename, save_file_resources=True)
 
         # Assert
-        resource_filename = path.join(TEMP_DIR, 'subdir', 'buffer.bin')
+        resource_filename = path.join(self.temp_dir, 'subdir', 'buffer.bin')
         self.assertTrue(path.exists(resource_filename))
-        with open(resource_filename, 'rb') as f:
-            self.assertEqual(data, f.read())
+        self.assertEqual(data, self._read_file(resource_filename))
 
     def test_skip_exporting_file_resources(self):
         """
         Ensure external file resources are skipped when exporting a GLTF model with save_file_resources set to False
         """
         # Arrange
-        resource_filename = path.join(TEMP_DIR, 'buffer.bin')
-        if path.exists(resource_filename):
-            os.remove(resource_filename)
+        resource_filename = path.join(self.temp_dir, 'buffer.bin')
         data = b'sample binary data'
         bytelen = len(data)
         resource = FileResource('buffer.bin', data=data)
         model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='buffer.bin', byteLength=bytelen)])
         gltf = GLTF(model=model, resources=[resource])
-        filename = path.join(TEMP_DIR, 'sample.gltf')
+        filename = path.join(self.temp_dir, 'sample.gltf')
 
         # Act
         gltf.export(filename, save_file_resources=False)
@@ -204,7 +235,7 @@ class TestGLTF(TestCase):
         # Arrange
         model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='buffer.bin', byteLength=1024)])
         gltf = GLTF(model=model)
-        filename = path.join(TEMP_DIR, 'sample.gltf')
+        filename = path.join(self.temp_dir, 'sample.gltf')
 
         # Act/Assert
         with self.assertRaisesRegex(RuntimeError, 'Missing resource'):
@@ -218,7 +249,7 @@ class TestGLTF(TestCase):
         # Arrange
         model = GLTFModel(asset=Asset(version='2.0'), images=[Image(uri='buffer.bin')])
         gltf = GLTF(model=model)
-        filename = path.join(TEMP_DIR, 'sample.gltf')
+        filename = path.join(self.temp_dir, 'sample.gltf')
 
         # Act/Assert
         with self.assertRaisesRegex(RuntimeError, 'Missing resource'):
@@ -291,7 +322,7 @@ class TestGLTF(TestCase):
         """
         # Arrange
         # Load a glTF model with load_file_resources set to False
-        gltf = GLTF.load(sample('BoxTextured'), load_file_resources=False)
+        gltf = self._load_sample('BoxTextured')
         # Resource should initially not be loaded
         resource = gltf.get_resource('CesiumLogoFlat.png')
         self.assertIsInstance(resource, FileResource)
@@ -342,6 +373,48 @@ class TestGLTF(TestCase):
         # Resource data should be the same
         self.assertEqual(resource.data, cloned_glb_resource.data)
 
+    def test_clone_model_with_base64_resource(self):
+        """
+        Cloning a model with a Base64Resource should clone the resource, reusing the encoded data URI rather than
+        encoding the data again.
+        """
+        # Arrange
+        resource = Base64Resource(b'sample binary data', 'image/png')
+        model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri=resource.uri, byteLength=18)])
+        gltf = GLTF(model=model, resources=[resource])
+
+        # Act
+        with patch('base64.b64encode', side_effect=AssertionError('Data should not be encoded again')):
+            cloned_gltf = gltf.clone()
+
+        # Assert
+        self.assertEqual(1, len(cloned_gltf.resources))
+        cloned_resource = cloned_gltf.resources[0]
+        self.assertIsInstance(cloned_resource, Base64Resource)
+        self.assertIsNot(cloned_resource, resource)
+        self.assertEqual(resource.uri, cloned_resource.uri)
+        self.assertEqual(b'sample binary data', cloned_resource.data)
+        self.assertEqual('image/png', cloned_resource.mime_type)
+
+    def test_clone_model_with_embedded_glb_data(self):
+        """
+        Once resources are embedded, the GLB resource data is mutable. Cloning the model should copy the data, so that
+        modifying the data of the clone does not affect the original.
+        """
+        # Arrange
+        resource = FileResource('buffer.bin', data=b'sample binary data')
+        model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='buffer.bin', byteLength=18)])
+        gltf = GLTF(model=model, resources=[resource])
+        glb_resource = gltf.embed_resource(resource)
+
+        # Act
+        cloned_gltf = gltf.clone()
+        cloned_gltf.get_glb_resource().data[0:6] = b'cloned'
+
+        # Assert
+        self.assertEqual(b'sample binary data\x00\x00', glb_resource.data)
+        self.assertEqual(b'cloned binary data\x00\x00', cloned_gltf.get_glb_resource().data)
+
     def test_embed_file_resource(self):
         """Test embedding a file resource"""
         # Arrange
@@ -505,7 +578,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[file_resource])
 
         # Act
-        filename = path.join(TEMP_DIR, 'sample.glb')
+        filename = path.join(self.temp_dir, 'sample.glb')
         gltf2 = gltf.export(filename)
 
         # Assert
@@ -567,7 +640,7 @@ class TestGLTF(TestCase):
         ])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_multiple_buffers.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_multiple_buffers.glb')
         gltf2 = gltf.export(filename)
 
         # Assert
@@ -619,7 +692,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[FileResource(filename=image_filename, data=data, mimetype='image/jpeg')])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_embed_image.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_embed_image.glb')
         gltf.export(filename)
 
         # Assert
@@ -696,7 +769,7 @@ class TestGLTF(TestCase):
         ])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_mixed_resources.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_mixed_resources.glb')
         gltf2 = gltf.export(filename)
 
         # Assert
@@ -787,7 +860,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[glb_resource, file_resource])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_embedded_image.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_embedded_image.glb')
         gltf2 = gltf.export(filename)
 
         # Assert
@@ -840,7 +913,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[resource])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_existing_glb_buffer_and_resource.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_existing_glb_buffer_and_resource.glb')
         gltf.export(filename)
 
         # Assert
@@ -894,12 +967,12 @@ class TestGLTF(TestCase):
 
         # Act
         # Export the GLB (do not embed image resources)
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_external_image_resource.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_external_image_resource.glb')
         gltf.export_glb(filename, embed_image_resources=False)
 
         # Assert
         # Ensure the image got saved
-        self.assertTrue(path.exists(path.join(TEMP_DIR, image_filename)))
+        self.assertTrue(path.exists(path.join(self.temp_dir, image_filename)))
         # Read the file back in and verify expected structure
         glb = GLTF.load_glb(filename, load_file_resources=True)
         self.assertEqual(model.asset, glb.model.asset)
@@ -979,7 +1052,7 @@ class TestGLTF(TestCase):
 
         # Act
         # Export the GLB
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_more_than_two_resources.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_more_than_two_resources.glb')
         gltf.export_glb(filename)
 
         # Assert
@@ -1036,7 +1109,7 @@ class TestGLTF(TestCase):
 
         # Act
         # Export the GLB
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_more_than_two_images.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_more_than_two_images.glb')
         gltf.export_glb(filename)
 
         # Assert
@@ -1108,14 +1181,14 @@ class TestGLTF(TestCase):
 
         # Act
         # Export the GLB (do not embed buffer or image resources)
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_all_resources_remaining_external.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_all_resources_remaining_external.glb')
         gltf.export_glb(filename, embed_buffer_resources=False, embed_image_resources=False)
 
         # Assert
         # Ensure the buffer and image files got saved
-        self.assertTrue(path.exists(path.join(TEMP_DIR, buffer_1_filename)))
-        self.assertTrue(path.exists(path.join(TEMP_DIR, buffer_2_filename)))
-        self.assertTrue(path.exists(path.join(TEMP_DIR, image_filename)))
+        self.assertTrue(path.exists(path.join(self.temp_dir, buffer_1_filename)))
+        self.assertTrue(path.exists(path.join(self.temp_dir, buffer_2_filename)))
+        self.assertTrue(path.exists(path.join(self.temp_dir, image_filename)))
         # Read the file back in and verify expected structure
         glb = GLTF.load_glb(filename, load_file_resources=True)
         self.assertEqual(model.asset, glb.model.asset)
@@ -1172,10 +1245,6 @@ class TestGLTF(TestCase):
         # Sample image data (this will remain external, and we will skip actually saving it)
         image_filename = 'sample_image.png'
         image_data = b'sample image data'
-        # Delete sample image if it exists
-        image_path = path.join(TEMP_DIR, image_filename)
-        if path.exists(image_path):
-            os.remove(image_path)
         # Create GLTF Model
         model = GLTFModel(asset=Asset(version='2.0'),
                           buffers=[Buffer(uri=buffer_filename, byteLength=buffer_bytelen)],
@@ -1188,12 +1257,12 @@ class TestGLTF(TestCase):
 
         # Act
         # Export the GLB (do not embed image resources, and skip saving file resources)
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_external_image_resource_skip_saving_files.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_external_image_resource_skip_saving_files.glb')
         gltf.export_glb(filename, embed_image_resources=False, save_file_resources=False)
 
         # Assert
         # Ensure the image did NOT get saved
-        self.assertFalse(path.exists(path.join(TEMP_DIR, image_filename)))
+        self.assertFalse(path.exists(path.join(self.temp_dir, image_filename)))
         # Read the file back in and verify expected structure
         glb = GLTF.load_glb(filename)
         self.assertEqual(model.asset, glb.model.asset)
@@ -1222,7 +1291,7 @@ class TestGLTF(TestCase):
         """
         # Arrange
         # Load a glTF model with load_file_resources set to False
-        gltf = GLTF.load(sample('BoxTextured'), load_file_resources=False)
+        gltf = self._load_sample('BoxTextured')
         # Ensure resource is initially not loaded
         resource = gltf.get_resource('CesiumLogoFlat.png')
         self.assertIsInstance(resource, FileResource)
@@ -1230,7 +1299,7 @@ class TestGLTF(TestCase):
 
         # Act
         # Convert the glTF to a GLB
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_resource_not_yet_loaded.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_resource_not_yet_loaded.glb')
         exported_glb = gltf.export(filename)
 
         # Assert
@@ -1257,7 +1326,7 @@ class TestGLTF(TestCase):
         """
         # Arrange
         # Load a glTF model with load_file_resources set to False
-        gltf = GLTF.load(sample('BoxTextured'), load_file_resources=False)
+        gltf = self._load_sample('BoxTextured')
         # Resource should initially not be loaded
         resource = gltf.get_resource('CesiumLogoFlat.png')
         self.assertIsInstance(resource, FileResource)
@@ -1266,7 +1335,7 @@ class TestGLTF(TestCase):
         # Act
         # Convert the glTF to a GLB without embedding the resource. However, set save_file_resources to True, so
         # the image should still get loaded and saved.
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_resource_not_yet_loaded_without_embedding.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_resource_not_yet_loaded_without_embedding.glb')
         exported_glb = gltf.export_glb(filename, embed_image_resources=False, save_file_resources=True)
 
         # Assert
@@ -1277,12 +1346,10 @@ class TestGLTF(TestCase):
         self.assertIsInstance(exported_resource, FileResource)
         self.assertTrue(exported_resource.loaded)
         # Ensure image got saved
-        image_filename = path.join(TEMP_DIR, 'CesiumLogoFlat.png')
+        image_filename = path.join(self.temp_dir, 'CesiumLogoFlat.png')
         self.assertTrue(path.exists(image_filename))
-        with open(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'), 'rb') as f:
-            original_texture_data = f.read()
-        with open(image_filename, 'rb') as f:
-            texture_data = f.read()
+        original_texture_data = self._read_bytes(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'))
+        texture_data = self._read_file(image_filename)
         self.assertEqual(original_texture_data, texture_data)
 
     def test_resource_remains_not_loaded_when_exporting_glb_without_embedding_or_saving_file_resources(self):
@@ -1292,7 +1359,7 @@ class TestGLTF(TestCase):
         """
         # Arrange
         # Load a glTF model with load_file_resources set to False
-        gltf = GLTF.load(sample('BoxTextured'), load_file_resources=False)
+        gltf = self._load_sample('BoxTextured')
         # Resource should initially not be loaded
         resource = gltf.get_resource('CesiumLogoFlat.png')
         self.assertIsInstance(resource, FileResource)
@@ -1300,7 +1367,7 @@ class TestGLTF(TestCase):
 
         # Act
         # Convert the glTF to a GLB without embedding or saving image resources
-        filename = path.join(TEMP_DIR, 'test_resource_remains_not_loaded_when_exporting_glb_without_embedding_or_'
+        filename = path.join(self.temp_dir, 'test_resource_remains_not_loaded_when_exporting_glb_without_embedding_or_'
                                        'saving_file_resources.glb')
         gltf.export_glb(filename, embed_image_resources=False, save_file_resources=False)
 
@@ -1319,7 +1386,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[resource])
 
         # Act/Assert
-        filename = path.join(TEMP_DIR, 'test_export_gltf_raises_error_if_glb_resource_is_present.gltf')
+        filename = path.join(self.temp_dir, 'test_export_gltf_raises_error_if_glb_resource_is_present.gltf')
         with self.assertRaises(TypeError):
             gltf.export(filename)
 
@@ -1332,7 +1399,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[glb_resource_1, glb_resource_2])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_glb_with_multiple_glb_resources.glb')
+        filename = path.join(self.temp_dir, 'test_export_glb_with_multiple_glb_resources.glb')
         gltf2 = gltf.export(filename)
 
         # Assert
@@ -1368,6 +1435,102 @@ class TestGLTF(TestCase):
         self.assertEqual(b'data', glb_resource_1.data)
         self.assertEqual(b'more data\x00\x00\x00', glb_resource_2.data)
 
+    def test_write_large_glb_chunk_by_chunk(self):
+        """
+        Ensures that writing a GLB chunk by chunk (which is done for GLBs larger than
+        GLTF.GLB_BUFFERED_WRITE_MAX_BYTELENGTH) produces the same output as assembling the GLB in memory.
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(byteLength=4)])
+        resources = [GLBResource(b'data'), GLBResource(b'more data', resource_type=123)]
+        buffered = io.BytesIO()
+        GLTF(model=model, resources=resources).write_glb(buffered)
+        chunked = io.BytesIO()
+
+        # Act
+        with patch.object(GLTF, 'GLB_BUFFERED_WRITE_MAX_BYTELENGTH', 0), \
+                patch.object(GLTF, '_build_glb', side_effect=AssertionError('GLB should not be assembled in memory')):
+            GLTF(model=model, resources=resources).write_glb(chunked)
+
+        # Assert
+        self.assertEqual(buffered.getvalue(), chunked.getvalue())
+        self.assertEqual(0, len(chunked.getvalue()) % 4)
+
+    def test_write_large_glb_chunk_by_chunk_to_file(self):
+        """
+        Ensures that writing a GLB chunk by chunk directly to a file (where the chunks are written to the underlying
+        file descriptor) produces the same output as assembling the GLB in memory, including any data that was already
+        written to the stream.
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(byteLength=4)])
+        resources = [GLBResource(b'data'), GLBResource(bytearray(b'more data'), resource_type=123)]
+        buffered = io.BytesIO()
+        GLTF(model=model, resources=resources).write_glb(buffered)
+        filename = path.join(self.temp_dir, 'chunked.glb')
+
+        # Act
+        with patch.object(GLTF, 'GLB_BUFFERED_WRITE_MAX_BYTELENGTH', 0), open(filename, 'wb') as f:
+            f.write(b'prefix')
+            GLTF(model=model, resources=resources).write_glb(f)
+            f.write(b'suffix')
+
+        # Assert
+        self.assertEqual(b'prefix' + buffered.getvalue() + b'suffix', self._read_file(filename))
+
+    def test_write_large_glb_to_compressed_stream(self):
+        """
+        Ensures that a GLB that is written chunk by chunk to a stream that wraps a file (in this case, a gzip-compressed
+        file) is written through the stream rather than directly to the underlying file.
+        """
+        # Arrange
+        data = bytes(range(256)) * 64
+        model = GLTFModel(asset=Asset(version='2.0'), buffers=[Buffer(uri='buffer.bin', byteLength=len(data))])
+        gltf = GLTF(model=model, resources=[FileResource(filename='buffer.bin', data=data)])
+        filename = path.join(self.temp_dir, 'sample.glb.gz')
+
+        # Act
+        with patch.object(GLTF, 'GLB_BUFFERED_WRITE_MAX_BYTELENGTH', 0), gzip.open(filename, 'wb') as f:
+            gltf.write_glb(f, save_file_resources=False)
+
+        # Assert
+        with gzip.open(filename, 'rb') as f:
+            glb = GLTF.read_glb(f)
+        self.assertEqual(data, glb.get_glb_resource().data)
+
+    def test_read_glb_from_stream(self):
+        """
+        Ensures a GLB can be read from a stream that is not backed by a file (e.g., BytesIO), with the header and chunks
+        read through the stream with f.read.
+        """
+        # Arrange
+        stream = io.BytesIO(self._read_bytes(custom_sample('MultipleChunks/MultipleChunks.glb')))
+
+        # Act
+        gltf = GLTF.read_glb(stream)
+
+        # Assert
+        self.assertEqual('2.0', gltf.model.asset.version)
+        self.assertEqual([b'data', b'more data\x00\x00\x00'], [resource.data for resource in gltf.resources])
+
+    def test_read_glb_from_compressed_stream(self):
+        """
+        Ensures a GLB can be read from a stream that wraps a file (in this case, a gzip-compressed file), where the data
+        must be read through the stream rather than from the underlying file.
+        """
+        # Arrange
+        filename = path.join(self.temp_dir, 'MultipleChunks.glb.gz')
+        with gzip.open(filename, 'wb') as f:
+            f.write(self._read_bytes(custom_sample('MultipleChunks/MultipleChunks.glb')))
+
+        # Act
+        with gzip.open(filename, 'rb') as f:
+            gltf = GLTF.read_glb(f)
+
+        # Assert
+        self.assertEqual('2.0', gltf.model.asset.version)
+        self.assertEqual([b'data', b'more data\x00\x00\x00'], [resource.data for resource in gltf.resources])
+
     def test_create_base64_resource_from_uri(self):
         """Ensures a Base64Resource is created successfully using the Base64Resource.from_uri factory method."""
         # Arrage
@@ -1393,8 +1556,7 @@ class TestGLTF(TestCase):
         # Ensure byte length is correct
         self.assertEqual(648, len(resource.data))
         # Ensure binary data matches
-        with open(path.join(SAMPLES_DIR, 'Box/glTF/Box0.bin'), 'rb') as f:
-            data = f.read()
+        data = self._read_bytes(path.join(SAMPLES_DIR, 'Box/glTF/Box0.bin'))
         self.assertEqual(data, resource.data)
         # Ensure buffer URI is preserved as base64
         buffer = gltf.model.buffers[0]
@@ -1417,10 +1579,8 @@ class TestGLTF(TestCase):
         self.assertEqual(23516, len(image_resource.data))
         self.assertEqual(840, len(buffer_resource.data))
         # Ensure binary data matches on both resources
-        with open(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'), 'rb') as f1:
-            image_data = f1.read()
-        with open(path.join(SAMPLES_DIR, 'BoxTextured/glTF/BoxTextured0.bin'), 'rb') as f2:
-            buffer_data = f2.read()
+        image_data = self._read_bytes(path.join(SAMPLES_DIR, 'BoxTextured/glTF/CesiumLogoFlat.png'))
+        buffer_data = self._read_bytes(path.join(SAMPLES_DIR, 'BoxTextured/glTF/BoxTextured0.bin'))
         self.assertEqual(image_data, image_resource.data)
         self.assertEqual(buffer_data, buffer_resource.data)
         # Ensure image URI is preserved as base64
@@ -1467,7 +1627,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[resource_1, resource_2, resource_3])
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_gltf_with_base64_resources.gltf')
+        filename = path.join(self.temp_dir, 'test_export_gltf_with_base64_resources.gltf')
         exported_gltf = gltf.export(filename)
 
         # Assert
@@ -1541,7 +1701,7 @@ class TestGLTF(TestCase):
         gltf = GLTF.load(sample('BoxTextured', 'glTF-Embedded'))
 
         # Act
-        filename = path.join(TEMP_DIR, 'test_export_base64_resource_to_glb.glb')
+        filename = path.join(self.temp_dir, 'test_export_base64_resource_to_glb.glb')
         exported_glb = gltf.export(filename)
 
         # Assert
@@ -1793,7 +1953,7 @@ class TestGLTF(TestCase):
         FileResource was not initially loaded.
         """
         # Arrange
-        gltf = GLTF.load(sample('TriangleWithoutIndices'), load_file_resources=False)
+        gltf = self._load_sample('TriangleWithoutIndices')
         file_resource = gltf.get_resource('triangleWithoutIndices.bin')
         self.assertIsInstance(file_resource, FileResource)
         self.assertFalse(file_resource.loaded)
@@ -2462,7 +2622,7 @@ class TestGLTF(TestCase):
         self.assertEqual(gltf.get_resource('File Resource.bin', strict=True), None)
 
         # Act/Assert
-        gltf.export(path.join(TEMP_DIR, 'uri_encoding_save.glb'))
+        gltf.export(path.join(self.temp_dir, 'uri_encoding_save.glb'))
 
     def test_uri_encoding_load_save(self):
         """
@@ -2470,7 +2630,7 @@ class TestGLTF(TestCase):
         """
         # Act/Assert
         gltf = GLTF.load(sample('Box With Spaces'), load_file_resources=True)
-        gltf.export(path.join(TEMP_DIR, 'uri_encoding_load_save.glb'))
+        gltf.export(path.join(self.temp_dir, 'uri_encoding_load_save.glb'))
 
     def test_uri_encoding_save_mixed(self):
         """
@@ -2488,7 +2648,7 @@ class TestGLTF(TestCase):
         gltf = GLTF(model=model, resources=[file_resource])
 
         # Act/Assert
-        gltf.export(path.join(TEMP_DIR, 'uri_encoding_save_mixed.glb'))
+        gltf.export(path.join(self.temp_dir, 'uri_encoding_save_mixed.glb'))
 
     def test_uri_encoding_validate_mixed_base64(self):
         """
@@ -1,7 +1,15 @@
+import copy
 import json
+import math
+from dataclasses import dataclass
+from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 from ..util import sample
-from gltflib import GLTF, GLTFModel, Asset, Buffer, Animation, AnimationSampler, Channel, Target
+from gltflib import (
+    GLTF, GLTFModel, Accessor, Asset, Buffer, BufferView, Animation, AnimationSampler, Channel, Target, Sparse,
+    SparseIndices, SparseValues, Attributes, AccessorType, ComponentType, Node)
+from gltflib.utils import json_utils
 
 
 class TestGLTFModel(TestCase):
@@ -64,6 +72,102 @@ class TestGLTFModel(TestCase):
         data = json.loads(v)
         self.assertDictEqual(data, {'asset': {'version': '2.0', 'generator': ''}, 'buffers': [], 'extensions': {}})
 
+    def test_to_json_removes_None_values_in_extensions_and_extras(self):
+        """
+        Ensures that keys set to None are also removed from dictionaries nested inside extensions and extras (including
+        dictionaries inside lists) when encoding the model to JSON, without modifying the model itself.
+        """
+        # Arrange
+        extras = {'a': None, 'b': [{'c': None, 'd': 1}], 'e': {'f': None}}
+        model = GLTFModel(asset=Asset(), extensions={'KHR_test': {'g': None}}, extras=extras)
+
+        # Act
+        v = model.to_json()
+
+        # Assert
+        data = json.loads(v)
+        self.assertDictEqual(data, {'asset': {'version': '2.0'}, 'extensions': {'KHR_test': {}},
+                                    'extras': {'b': [{'d': 1}], 'e': {}}})
+        self.assertEqual({'a': None, 'b': [{'c': None, 'd': 1}], 'e': {'f': None}}, model.extras)
+
+    def test_to_json_bytes(self):
+        """Ensures the model can be encoded directly to UTF-8 encoded JSON bytes."""
+        # Arrange
+        model = GLTFModel(asset=Asset(generator='“Test” – Generator'), buffers=[Buffer(byteLength=4)])
+
+        # Act
+        v = model.to_json_bytes()
+
+        # Assert
+        self.assertIsInstance(v, bytes)
+        data = json.loads(v.decode('utf-8'))
+        self.assertDictEqual(data, {'asset': {'version': '2.0', 'generator': '“Test” – Generator'},
+                                    'buffers': [{'byteLength': 4}]})
+
+    def test_to_json_is_compact_by_default(self):
+        """
+        Ensures that the model is encoded to compact JSON (without whitespace) by default, even when orjson is not
+        installed, and that indented output is still produced when requested.
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(), buffers=[Buffer(byteLength=4)])
+
+        with patch('gltflib.utils.json_utils.orjson', None):
+            # Act
+            compact = model.to_json()
+            indented = model.to_json(indent=2)
+
+        # Assert
+        self.assertEqual('{"asset":{"version":"2.0"},"buffers":[{"byteLength":4}]}', compact)
+        self.assertEqual(json.dumps(json.loads(compact), indent=2), indented)
+
+    def test_to_json_with_values_not_supported_by_orjson(self):
+        """
+        Ensures that models are still encoded to JSON if extras or extensions contain values that orjson cannot encode
+        (dictionaries with non-string keys, or integers outside the 64-bit range).
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(), extras={1: 'a', 'n': 2 ** 70})
+
+        # Act
+        v = model.to_json()
+
+        # Assert
+        self.assertEqual('{"extras":{"1":"a","n":1180591620717411303424},"asset":{"version":"2.0"}}', v)
+
+    def test_to_json_with_non_finite_floats(self):
+        """
+        Ensures that NaN and infinite values are encoded as NaN and Infinity (as done by the json module from the
+        standard library), rather than as null (as done by orjson).
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(), nodes=[Node(translation=[math.nan, 0.0, math.inf])], extras={'a': [None]})
+
+        # Act
+        v = model.to_json()
+
+        # Assert
+        self.assertEqual('{"extras":{"a":[null]},"asset":{"version":"2.0"},'
+                         '"nodes":[{"translation":[NaN,0.0,Infinity]}]}', v)
+
+    def test_to_json_writes_non_ascii_characters_as_utf8(self):
+        """
+        Ensures that non-ASCII characters are written as UTF-8 when encoding to JSON with orjson (the json module from
+        the standard library escapes them instead). Both represent the same data.
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(generator='é'))
+
+        # Act
+        v = model.to_json_bytes()
+
+        # Assert
+        if json_utils.orjson is not None:
+            self.assertEqual('{"asset":{"generator":"é","version":"2.0"}}'.encode('utf-8'), v)
+        else:
+            self.assertEqual(b'{"asset":{"generator":"\\u00e9","version":"2.0"}}', v)
+        self.assertEqual('é', json.loads(v)['asset']['generator'])
+
     def test_decode(self):
         """Ensures that a simple model can be decoded successfully from JSON."""
         # Arrange
@@ -75,6 +179,181 @@ class TestGLTFModel(TestCase):
         # Assert
         self.assertEqual(model, GLTFModel(asset=Asset(version='2.1'), buffers=[Buffer(uri='triangle.bin', byteLength=44)]))
 
+    def test_decode_unpaired_surrogate(self):
+        """
+        Ensures that models can be decoded from JSON containing strings with unpaired surrogate escapes, which are
+        rejected by orjson (but accepted by the json module from the standard library).
+        """
+        # Arrange
+        v = '{"asset": {"version": "2.0"}, "nodes": [{"name": "\\ud800"}]}'
+
+        # Act
+        model = GLTFModel.from_json(v)
+
+        # Assert
+        self.assertEqual('\ud800', model.nodes[0].name)
+
+    def test_decode_nan(self):
+        """
+        Ensures that models can be decoded from JSON containing NaN values, which are rejected by orjson (but accepted
+        by the json module from the standard library, which also writes them).
+        """
+        # Arrange
+        v = '{"asset": {"version": "2.0"}, "nodes": [{"translation": [NaN, 0, 0]}]}'
+
+        # Act
+        model = GLTFModel.from_json(v)
+
+        # Assert
+        self.assertTrue(math.isnan(model.nodes[0].translation[0]))
+        self.assertEqual([0.0, 0.0], model.nodes[0].translation[1:])
+
+    def test_decode_accessors_buffer_views_and_buffers(self):
+        """Ensures accessors (including sparse accessors), buffer views, and buffers are decoded correctly."""
+        # Arrange
+        v = '{"asset": {"version": "2.0"}, ' \
+            '"accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3", "max": [1, 2, 3], ' \
+            '"sparse": {"count": 1, "indices": {"bufferView": 1, "byteOffset": 0, "componentType": 5123}, ' \
+            '"values": {"bufferView": 2, "byteOffset": 0}}}], ' \
+            '"bufferViews": [{"buffer": 0, "byteLength": 12, "extras": {"foo": "bar"}}], ' \
+            '"buffers": [{"uri": "triangle.bin", "byteLength": 44}]}'
+
+        # Act
+        model = GLTFModel.from_json(v)
+
+        # Assert
+        self.assertEqual(model, GLTFModel(
+            asset=Asset(version='2.0'),
+            accessors=[Accessor(bufferView=0, componentType=5126, count=3, type='VEC3', max=[1, 2, 3],
+                                sparse=Sparse(count=1,
+                                              indices=SparseIndices(bufferView=1, byteOffset=0, componentType=5123),
+                                              values=SparseValues(bufferView=2, byteOffset=0)))],
+            bufferViews=[BufferView(buffer=0, byteLength=12, extras={'foo': 'bar'})],
+            buffers=[Buffer(uri='triangle.bin', byteLength=44)]))
+
+    def test_decode_coerces_values_and_applies_defaults(self):
+        """
+        Ensures that when decoding, scalar values are coerced to the declared type of each property (e.g., integers in
+        float properties become floats), and that missing properties are set to their default values.
+        """
+        # Arrange
+        v = '{"asset": {}, "nodes": [{"mesh": 0, "translation": [1, 2, 3]}], "meshes": [{"primitives": [{}]}]}'
+
+        # Act
+        model = GLTFModel.from_json(v)
+
+        # Assert
+        self.assertEqual('2.0', model.asset.version)
+        self.assertEqual([1.0, 2.0, 3.0], model.nodes[0].translation)
+        self.assertTrue(all(isinstance(value, float) for value in model.nodes[0].translation))
+        self.assertEqual(Attributes(), model.meshes[0].primitives[0].attributes)
+        self.assertEqual('{"asset":{"version":"2.0"},"meshes":[{"primitives":[{"attributes":{}}]}],'
+                         '"nodes":[{"mesh":0,"translation":[1.0,2.0,3.0]}]}',
+                         model.to_json())
+
+    def test_decode_accessor_missing_required_property(self):
+        """
+        Ensures that a warning is emitted when decoding an accessor from JSON if any required properties are missing.
+        In this case, the "componentType" property on the accessor is missing.
+        """
+        # Arrange
+        v = '{"asset": {"version": "2.0"}, "accessors": [{"count": 1, "type": "SCALAR"}]}'
+
+        # Act/Assert
+        with self.assertWarnsRegex(RuntimeWarning, "non-optional type componentType"):
+            _ = GLTFModel.from_json(v)
+
+    def test_subclass_with_additional_fields(self):
+        """
+        Ensures that models subclassed with additional fields retain those fields when they are decoded from and encoded
+        to dictionaries and JSON.
+        """
+        # Arrange
+        @dataclass
+        class CustomNode(Node):
+            custom: int = 0
+
+        model = GLTFModel(asset=Asset(), nodes=[CustomNode(name='node', custom=5)])
+
+        # Act
+        decoded = CustomNode.from_dict({'name': 'node', 'custom': 7})
+        encoded = model.nodes[0].to_dict()
+        v = model.to_json()
+
+        # Assert
+        self.assertEqual(CustomNode(name='node', custom=7), decoded)
+        self.assertEqual(5, encoded['custom'])
+        self.assertEqual('{"asset":{"version":"2.0"},"nodes":[{"name":"node","custom":5}]}', v)
+
+    def test_deepcopy(self):
+        """
+        Ensures that a deep copy of a model is equal to the original, and that nested models, lists, and extensions and
+        extras are copied rather than shared with the original.
+        """
+        # Arrange
+        model = GLTFModel(asset=Asset(), accessors=[Accessor(componentType=5126, count=3, type='VEC3', max=[1, 2, 3])],
+                          extras={'a': [{'b': 1}]})
+
+        # Act
+        v = copy.deepcopy(model)
+
+        # Assert
+        self.assertEqual(model, v)
+        self.assertIsNot(model.asset, v.asset)
+        self.assertIsNot(model.accessors, v.accessors)
+        self.assertIsNot(model.accessors[0], v.accessors[0])
+        self.assertIsNot(model.accessors[0].max, v.accessors[0].max)
+        self.assertIsNot(model.extras['a'][0], v.extras['a'][0])
+
+    def test_deepcopy_subclass_with_additional_fields(self):
+        """
+        Ensures that a deep copy of a model subclassed with additional fields (or a model with additional attributes)
+        retains the values of those fields and attributes.
+        """
+        # Arrange
+        @dataclass
+        class CustomNode(Node):
+            custom: List[int] = None
+
+        node = CustomNode(name='node', custom=[5])
+        accessor = Accessor(componentType=5126, count=3, type='VEC3')
+        accessor.custom = [6]
+
+        # Act
+        node_copy = copy.deepcopy(node)
+        accessor_copy = copy.deepcopy(accessor)
+
+        # Assert
+        self.assertEqual(node, node_copy)
+        self.assertEqual([5], node_copy.custom)
+        self.assertIsNot(node.custom, node_copy.custom)
+        self.assertEqual([6], accessor_copy.custom)
+        self.assertIsNot(accessor.custom, accessor_copy.custom)
+
+    def test_accessor_element_byte_size(self):
+        """
+        Ensures the element byte size of an accessor is computed from its component type and accessor type, including
+        the column alignment that applies to matrices with 1-byte and 2-byte components.
+        """
+        # Arrange
+        cases = [
+            (ComponentType.FLOAT, AccessorType.SCALAR, 4),
+            (ComponentType.FLOAT, AccessorType.VEC3, 12),
+            (ComponentType.UNSIGNED_SHORT, AccessorType.VEC2, 4),
+            (ComponentType.UNSIGNED_BYTE, AccessorType.VEC4, 4),
+            (ComponentType.FLOAT, AccessorType.MAT4, 64),
+            (ComponentType.BYTE, AccessorType.MAT2, 8),
+            (ComponentType.BYTE, AccessorType.MAT3, 12),
+            (ComponentType.SHORT, AccessorType.MAT3, 24)
+        ]
+
+        for component_type, accessor_type, expected in cases:
+            # Act
+            accessor = Accessor(componentType=component_type.value, count=1, type=accessor_type.value)
+
+            # Assert
+            self.assertEqual(expected, accessor.element_byte_size(), f'{component_type.name} {accessor_type.name}')
+
     def test_decode_missing_required_property(self):
         """
         Ensures that a warning is emitted when decoding a model from JSON if any required properties are missing.
@@ -1,10 +1,20 @@
+import atexit
 import os
 import shutil
+import tempfile
+from functools import lru_cache
 from os import path
 
 
-# Temporary directory used for tests (cleared on every run)
-TEMP_DIR = 'tests/temp'
+# Temporary directory used for tests. A new directory is created for every run and removed at exit. Unless a
+# different location is requested by setting TMPDIR, the directory is created on the memory-backed /dev/shm filesystem
+# where available, so the files written and read back by the tests never need to reach the disk. Worker processes
+# started by the tests inherit the directory via the environment rather than creating their own.
+TEMP_DIR = os.environ.get('GLTFLIB_TEST_TEMP_DIR')
+if TEMP_DIR is None:
+    _temp_root = '/dev/shm' if 'TMPDIR' not in os.environ and os.access('/dev/shm', os.W_OK) else None
+    TEMP_DIR = os.environ['GLTFLIB_TEST_TEMP_DIR'] = tempfile.mkdtemp(prefix='gltflib-', dir=_temp_root)
+    atexit.register(shutil.rmtree, TEMP_DIR, ignore_errors=True)
 
 # Directory containing the official glTF sample files. These samples are the same ones that are available here:
 # https://github.com/KhronosGroup/glTF-Sample-Models
@@ -14,6 +24,7 @@ SAMPLES_DIR = 'tests/samples/glTF-Sample-Models/2.0'
 CUSTOM_SAMPLES_DIR = 'tests/samples/custom'
 
 
+@lru_cache(maxsize=None)
 def sample(model, fmt='glTF'):
     """
     Helper function for returning the path to an official sample model from the glTF-Sample-Models directory in the
@@ -26,6 +37,7 @@ def sample(model, fmt='glTF'):
     return path.join(SAMPLES_DIR, model, fmt, model + ext)
 
 
+@lru_cache(maxsize=None)
 def custom_sample(filename):
     """
     Helper function for returning the path to a custom sample model (as opposed to an official sample model from the
@@ -37,9 +49,3 @@ def custom_sample(filename):
     """
     return path.join(CUSTOM_SAMPLES_DIR, filename)
 
-
-def setup_temp_dir():
-    """Creates TEMP_DIR (if it does not already exist) and ensures it is empty."""
-    if path.exists(TEMP_DIR):
-        shutil.rmtree(TEMP_DIR)
-    os.makedirs(TEMP_DIR)